@@ -0,0 +1,58 @@
+"""
+Shared boto3 clients for strands-pack AWS tools.
+
+Tools that talk to the same service in the same region share one client, so
+they reuse its endpoint setup, connection pool and retry configuration.
+
+Defaults:
+- adaptive retries (5 attempts)
+- TCP keepalive on pooled connections
+
+The region (AWS_REGION / AWS_DEFAULT_REGION), AWS_PROFILE and AWS_ACCESS_KEY_ID are
+read on every call; a change to any of them gets a new client from a fresh session.
+Credentials that change behind an unchanged profile or key id (e.g. a rewritten
+~/.aws/credentials entry) are only picked up by a new process.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    import boto3
+    from botocore.config import Config
+except ImportError:  # pragma: no cover
+    boto3 = None
+    Config = None
+
+
+_client_lock = threading.Lock()
+
+
+def _client_config():
+    # Adaptive retries back off client-side only when throttled; keepalive stops idle pooled
+    # connections being dropped between agent turns, so the next call skips a fresh handshake
+    return Config(retries={"mode": "adaptive", "max_attempts": 5}, tcp_keepalive=True)
+
+
+@lru_cache(maxsize=8)
+def _client_for(service: str, region: Optional[str], profile: Optional[str], access_key_id: Optional[str]):
+    """Build one boto3 client per (service, region, credential source) and hand the same instance back afterwards."""
+    # A fresh Session resolves AWS_PROFILE / env credentials now; boto3's default session
+    # would keep whatever it resolved first. access_key_id only keys the cache.
+    with _client_lock:
+        session = boto3.Session(profile_name=profile)
+        return session.client(service, region_name=region, config=_client_config())
+
+
+def _region() -> Optional[str]:
+    # Read per call so a changed AWS_REGION / AWS_DEFAULT_REGION gets its own client
+    return os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
+
+
+def aws_client(service: str) -> Any:
+    """Return the shared boto3 client for service in the current region and credential source."""
+    return _client_for(service, _region(), os.getenv("AWS_PROFILE"), os.getenv("AWS_ACCESS_KEY_ID"))
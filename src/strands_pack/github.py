@@ -113,6 +113,8 @@ except ImportError:
 
 GITHUB_API_BASE = "https://api.github.com"
 
+_session = None
+
 
 def _check_requests() -> Optional[Dict[str, Any]]:
     """Check if requests is installed."""
@@ -124,6 +126,14 @@ def _check_requests() -> Optional[Dict[str, Any]]:
     return None
 
 
+def _get_session():
+    """Return a shared requests.Session so repeated calls reuse the TLS connection to the API."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
 def _get_token() -> Optional[str]:
     """Get GitHub token from environment."""
     return os.environ.get("GITHUB_TOKEN")
@@ -156,7 +166,7 @@ def _make_request(
     if headers_override:
         headers.update(headers_override)
 
-    response = requests.request(method, url, headers=headers, timeout=30, **kwargs)
+    response = _get_session().request(method, url, headers=headers, timeout=30, **kwargs)
 
     if response.status_code >= 400:
         error_data: Dict[str, Any] = {}
@@ -24,13 +24,19 @@ import sys
 import time
 from collections import deque
 from pathlib import Path
-from typing import Any, Deque, Dict, Literal, Optional
+from typing import Any, Deque, Dict, Literal, Optional, get_args
 
 from strands import tool
 
 Action = Literal["notify", "beep", "play_file"]
 Level = Literal["info", "success", "warning", "error"]
 
+# Membership sets and help text derived once from the Literals above
+_VALID_ACTIONS = frozenset(get_args(Action))
+_ACTIONS_HELP = str(list(get_args(Action)))
+_VALID_LEVELS = frozenset(get_args(Level))
+_LEVELS_HELP = ", ".join(get_args(Level))
+
 _RECENT: Deque[float] = deque()
 _RECENT_DEDUPE: Dict[str, float] = {}
 
@@ -185,12 +191,11 @@ def notify(
             - routed_to: "local"/"sns"/"webhook"/"none" (for notify)
             - message_id/status_code (when applicable)
     """
-    valid_actions = ("notify", "beep", "play_file")
-    if action not in valid_actions:
-        return _err(f"Invalid action '{action}'. Must be one of: {list(valid_actions)}")
+    if action not in _VALID_ACTIONS:
+        return _err(f"Invalid action '{action}'. Must be one of: {_ACTIONS_HELP}")
 
-    if level not in ("info", "success", "warning", "error"):
-        return _err("level must be one of: info, success, warning, error")
+    if level not in _VALID_LEVELS:
+        return _err(f"level must be one of: {_LEVELS_HELP}")
 
     if not _rate_limit_ok(rate_limit_per_minute):
         return _err("Rate limited: too many notifications per minute", error_type="RateLimited")
@@ -41,17 +41,14 @@ from __future__ import annotations
 
 import math
 import os
+from importlib.util import find_spec
 from typing import Any, Dict, List, Optional
 
 from strands import tool
 
-try:
-    from openai import OpenAI
-
-    HAS_OPENAI = True
-except ImportError:  # pragma: no cover
-    OpenAI = None
-    HAS_OPENAI = False
+# openai is slow to import (its generated types dominate `import strands_pack`),
+# so only probe for it here and import it on first client construction.
+HAS_OPENAI = find_spec("openai") is not None
 
 
 def _ok(**data: Any) -> Dict[str, Any]:
@@ -85,6 +82,8 @@ def _get_client(client_override: Any):
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable not set")
+    from openai import OpenAI
+
     return OpenAI(api_key=api_key)
 
 
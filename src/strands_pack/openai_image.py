@@ -94,6 +94,36 @@ PLATFORM_SIZES = {
     "blog": "1792x1024",
 }
 
+# Lookup tables built once at import rather than per call
+_MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+    ".gif": "image/gif",
+}
+
+_STYLE_HINTS = {
+    "photorealistic": "photorealistic, highly detailed, professional photography",
+    "illustration": "digital illustration, artistic, stylized",
+    "cartoon": "cartoon style, vibrant colors, playful",
+    "minimalist": "minimalist design, clean, simple, modern",
+    "dramatic": "dramatic lighting, high contrast, cinematic",
+    "professional": "professional, polished, corporate quality",
+    "vintage": "vintage style, retro aesthetic, nostalgic",
+    "watercolor": "watercolor painting style, soft edges, artistic",
+    "3d": "3D rendered, volumetric lighting, detailed textures",
+}
+
+# Platform-specific analysis prompts
+_PLATFORM_PROMPTS = {
+    "youtube": "Analyze this YouTube thumbnail for effectiveness. Consider: visual impact in 0.3 seconds, face visibility, text readability, color contrast, clickthrough potential, emotional appeal.",
+    "instagram": "Analyze this Instagram image for effectiveness. Consider: square format optimization, mobile-first design, feed aesthetics, engagement potential, brand consistency.",
+    "twitter": "Analyze this Twitter/X image for effectiveness. Consider: timeline visibility, text clarity, visual impact, shareability, brand recognition.",
+    "facebook": "Analyze this Facebook image for effectiveness. Consider: news feed visibility, engagement potential, mobile display, text-to-image ratio.",
+    "blog": "Analyze this blog image for effectiveness. Consider: professional appearance, topic relevance, web optimization, SEO potential, reader engagement.",
+}
+
 
 # -----------------------------------------------------------------------------
 # Internal Helper Functions
@@ -139,14 +169,7 @@ def _load_image_base64(image_path: str) -> str:
 def _get_mime_type(path: Path) -> str:
     """Get MIME type from file extension."""
     suffix = path.suffix.lower()
-    mime_map = {
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".webp": "image/webp",
-        ".gif": "image/gif",
-    }
-    return mime_map.get(suffix, "image/png")
+    return _MIME_TYPES.get(suffix, "image/png")
 
 
 def _save_image(
@@ -201,19 +224,7 @@ def _enhance_prompt(prompt: str, style: Optional[str] = None) -> str:
     if not style:
         return prompt
 
-    style_hints = {
-        "photorealistic": "photorealistic, highly detailed, professional photography",
-        "illustration": "digital illustration, artistic, stylized",
-        "cartoon": "cartoon style, vibrant colors, playful",
-        "minimalist": "minimalist design, clean, simple, modern",
-        "dramatic": "dramatic lighting, high contrast, cinematic",
-        "professional": "professional, polished, corporate quality",
-        "vintage": "vintage style, retro aesthetic, nostalgic",
-        "watercolor": "watercolor painting style, soft edges, artistic",
-        "3d": "3D rendered, volumetric lighting, detailed textures",
-    }
-
-    hint = style_hints.get(style.lower(), style)
+    hint = _STYLE_HINTS.get(style.lower(), style)
     return f"{prompt}, {hint}"
 
 
@@ -421,16 +432,7 @@ def _analyze_image(
 
     mime_type = _get_mime_type(Path(image_path))
 
-    # Platform-specific analysis prompts
-    platform_prompts = {
-        "youtube": "Analyze this YouTube thumbnail for effectiveness. Consider: visual impact in 0.3 seconds, face visibility, text readability, color contrast, clickthrough potential, emotional appeal.",
-        "instagram": "Analyze this Instagram image for effectiveness. Consider: square format optimization, mobile-first design, feed aesthetics, engagement potential, brand consistency.",
-        "twitter": "Analyze this Twitter/X image for effectiveness. Consider: timeline visibility, text clarity, visual impact, shareability, brand recognition.",
-        "facebook": "Analyze this Facebook image for effectiveness. Consider: news feed visibility, engagement potential, mobile display, text-to-image ratio.",
-        "blog": "Analyze this blog image for effectiveness. Consider: professional appearance, topic relevance, web optimization, SEO potential, reader engagement.",
-    }
-
-    analysis_prompt = platform_prompts.get(platform, platform_prompts["youtube"])
+    analysis_prompt = _PLATFORM_PROMPTS.get(platform, _PLATFORM_PROMPTS["youtube"])
 
     try:
         client = _get_client(api_key)
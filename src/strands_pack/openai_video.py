@@ -56,18 +56,17 @@ from __future__ import annotations
 import os
 import time
 from datetime import datetime
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from strands import tool
 
-try:
-    from openai import OpenAI
+# Probe only; openai is imported on first client construction (see openai_embeddings).
+HAS_OPENAI = find_spec("openai") is not None
 
-    HAS_OPENAI = True
-except ImportError:  # pragma: no cover
-    OpenAI = None
-    HAS_OPENAI = False
+# Floor for the wait-loop poll interval so callers can't hammer the API; tests lower it
+_MIN_POLL_INTERVAL_SECONDS = 1
 
 
 def _ok(**data: Any) -> Dict[str, Any]:
@@ -101,6 +100,8 @@ def _get_client(client_override: Any):
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable not set")
+    from openai import OpenAI
+
     return OpenAI(api_key=api_key)
 
 
@@ -294,7 +295,7 @@ def _wait_for_completion(
                 last_status=status,
                 last_video=res.get("video"),
             )
-        time.sleep(max(1, int(poll_interval_seconds)))
+        time.sleep(max(_MIN_POLL_INTERVAL_SECONDS, int(poll_interval_seconds)))
 
 
 def _download_to_file(
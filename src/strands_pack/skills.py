@@ -67,6 +67,8 @@ except ImportError:
 
 DEFAULT_SKILLS_DIR = "~/.agent-skills"
 
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+
 
 def _ok(**data: Any) -> Dict[str, Any]:
     out: Dict[str, Any] = {"success": True}
@@ -92,8 +94,7 @@ def _parse_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
     Parse YAML frontmatter from markdown content.
     Returns (frontmatter_dict, body_content)
     """
-    pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(pattern, content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
 
     if not match:
         return {}, content
@@ -21,12 +21,14 @@ Actions
 
 from __future__ import annotations
 
+import json
 import os
 import re
 from typing import Any, Dict, List, Optional
 
 from strands import tool
 
+from strands_pack.aws_clients import aws_client
 from strands_pack.aws_tags import aws_tags_list
 
 try:
@@ -39,15 +41,16 @@ except ImportError:  # pragma: no cover
 
 
 def _get_client():
+    """Return the shared SNS client so calls reuse its endpoint setup and connection pool."""
     if not HAS_BOTO3:
         raise ImportError("boto3 not installed. Run: pip install strands-pack[aws]")
-    return boto3.client("sns")
+    return aws_client("sns")
 
 
 def _get_lambda():
     if not HAS_BOTO3:
         raise ImportError("boto3 not installed. Run: pip install strands-pack[aws]")
-    return boto3.client("lambda")
+    return aws_client("lambda")
 
 
 def _lambda_prefix() -> str:
@@ -186,13 +189,13 @@ def sns(
             return _ok(topic_arn=topic_arn, deleted=True)
 
         if action == "list_topics":
-            resp = client.list_topics()
-            topics = resp.get("Topics", []) or []
+            # ListTopics returns 100 topics per page; walk every page rather than truncating
             formatted = []
-            for t in topics:
-                arn = t.get("TopicArn", "")
-                name = arn.split(":")[-1] if arn else ""
-                formatted.append({"name": name, "arn": arn})
+            for page in client.get_paginator("list_topics").paginate():
+                for t in page.get("Topics", []) or []:
+                    arn = t.get("TopicArn", "")
+                    name = arn.rpartition(":")[2]
+                    formatted.append({"name": name, "arn": arn})
             return _ok(topics=formatted, count=len(formatted))
 
         if action == "get_topic_attributes":
@@ -241,7 +244,6 @@ def sns(
                 "Endpoint": endpoint,
             }
             if filter_policy:
-                import json
                 sub_args["Attributes"] = {"FilterPolicy": json.dumps(filter_policy)}
             resp = client.subscribe(**sub_args)
             sub_arn = resp.get("SubscriptionArn", "")
@@ -281,7 +283,7 @@ def sns(
 
             # Option A: add invoke permission so SNS can invoke Lambda, scoped to this topic ARN.
             lam = _get_lambda()
-            topic_name_for_id = topic_arn.split(":")[-1] if topic_arn else "topic"
+            topic_name_for_id = topic_arn.rpartition(":")[2] or "topic"
             fn_name_for_id = _extract_lambda_name(target_arn)
             sid = _sanitize_statement_id(statement_id or f"sns-invoke-{topic_name_for_id}-{fn_name_for_id}")
             permission_added = False
@@ -305,7 +307,6 @@ def sns(
                 "Endpoint": target_arn,
             }
             if filter_policy:
-                import json
                 sub_args["Attributes"] = {"FilterPolicy": json.dumps(filter_policy)}
             resp = client.subscribe(**sub_args)
             sub_arn = resp.get("SubscriptionArn", "")
@@ -327,20 +328,20 @@ def sns(
 
         if action == "list_subscriptions":
             if topic_arn:
-                resp = client.list_subscriptions_by_topic(TopicArn=topic_arn)
+                pages = client.get_paginator("list_subscriptions_by_topic").paginate(TopicArn=topic_arn)
             else:
-                resp = client.list_subscriptions()
-            subs = resp.get("Subscriptions", []) or []
+                pages = client.get_paginator("list_subscriptions").paginate()
             formatted: List[Dict[str, Any]] = []
-            for s in subs:
-                t_arn = s.get("TopicArn", "")
-                formatted.append({
-                    "topic": t_arn.split(":")[-1] if t_arn else "",
-                    "topic_arn": t_arn,
-                    "protocol": s.get("Protocol"),
-                    "endpoint": s.get("Endpoint"),
-                    "subscription_arn": s.get("SubscriptionArn"),
-                })
+            for page in pages:
+                for s in page.get("Subscriptions", []) or []:
+                    t_arn = s.get("TopicArn", "")
+                    formatted.append({
+                        "topic": t_arn.rpartition(":")[2],
+                        "topic_arn": t_arn,
+                        "protocol": s.get("Protocol"),
+                        "endpoint": s.get("Endpoint"),
+                        "subscription_arn": s.get("SubscriptionArn"),
+                    })
             return _ok(
                 subscriptions=formatted,
                 count=len(formatted),
@@ -10,6 +10,8 @@ Supported actions
 -----------------
 - execute
     Parameters: db_path (required), sql (required), params (optional - list or dict)
+- execute_script
+    Parameters: db_path (required), sql (required - one or more ;-separated statements)
 - query
     Parameters: db_path (required), sql (required), params (optional), limit (default 100)
 - create_table
@@ -52,6 +54,7 @@ Supported actions
 Notes:
   - All operations auto-commit by default
   - Use :memory: as db_path for in-memory database
+  - db_path may also be a SQLite URI (e.g. "file:mem1?mode=memory&cache=shared")
   - SQL injection is prevented via parameterized queries
   - Column types: TEXT, INTEGER, REAL, BLOB, NULL
 """
@@ -62,7 +65,8 @@ import csv
 import os
 import sqlite3
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import quote, unquote
 
 from strands import tool
 
@@ -81,14 +85,51 @@ def _err(message: str, *, error_type: Optional[str] = None, **data: Any) -> Dict
     return out
 
 
+def _is_uri(db_path: str) -> bool:
+    """Return True if db_path is a SQLite URI filename (file:...)."""
+    return db_path.startswith("file:")
+
+
+def _is_memory(db_path: str) -> bool:
+    """Return True if db_path refers to an in-memory database."""
+    return db_path == ":memory:" or (_is_uri(db_path) and "mode=memory" in _split_uri(db_path)[1].split("&"))
+
+
+def _split_uri(db_path: str) -> Tuple[str, str]:
+    """Split a file: URI into its percent-decoded file path and its query string."""
+    rest = db_path[len("file:"):].split("#", 1)[0]
+    path, _, query = rest.partition("?")
+    if path.startswith("//"):
+        # file://[localhost]/path - drop the authority, keep the absolute path
+        path = "/" + path[2:].partition("/")[2]
+    return unquote(path), query
+
+
+def _db_file_path(db_path: str) -> Path:
+    """Return the on-disk path for a file path or file: URI."""
+    if _is_uri(db_path):
+        db_path = _split_uri(db_path)[0]
+    return Path(db_path).expanduser()
+
+
 def _get_connection(db_path: str) -> sqlite3.Connection:
     """Get a database connection."""
-    if db_path != ":memory:":
-        path = Path(db_path).expanduser()
-        path.parent.mkdir(parents=True, exist_ok=True)
-        db_path = str(path)
+    if _is_uri(db_path):
+        if not _is_memory(db_path):
+            # Open the same file _db_file_path reports (~ expanded, parents created)
+            path = _db_file_path(db_path)
+            query = _split_uri(db_path)[1]
+            if "mode=ro" not in query:
+                path.parent.mkdir(parents=True, exist_ok=True)
+            db_path = "file:" + quote(str(path)) + (f"?{query}" if query else "")
+        conn = sqlite3.connect(db_path, uri=True)
+    else:
+        if db_path != ":memory:":
+            path = Path(db_path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db_path = str(path)
+        conn = sqlite3.connect(db_path)
 
-    conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -144,6 +185,27 @@ def _execute(db_path: str, sql: str, params: Optional[Union[List, Dict]] = None,
         conn.close()
 
 
+def _execute_script(db_path: str, sql: str, **kwargs) -> Dict[str, Any]:
+    """Execute multiple SQL statements in one call (no parameters)."""
+    if not db_path:
+        return _err("db_path is required")
+    if not sql:
+        return _err("sql is required")
+
+    conn = _get_connection(db_path)
+    try:
+        conn.executescript(sql)
+        conn.commit()
+
+        return _ok(
+            action="execute_script",
+            db_path=db_path,
+            total_changes=conn.total_changes,
+        )
+    finally:
+        conn.close()
+
+
 def _query(db_path: str, sql: str, params: Optional[Union[List, Dict]] = None,
            limit: int = 100, **kwargs) -> Dict[str, Any]:
     """Execute a SELECT query and return results."""
@@ -762,10 +824,10 @@ def _get_info(db_path: str, **kwargs) -> Dict[str, Any]:
     if not db_path:
         return _err("db_path is required")
 
-    if db_path == ":memory:":
+    if _is_memory(db_path):
         file_size = 0
     else:
-        path = Path(db_path).expanduser()
+        path = _db_file_path(db_path)
         if not path.exists():
             return _err(f"Database not found: {db_path}")
         file_size = path.stat().st_size
@@ -810,10 +872,10 @@ def _backup(db_path: str, backup_path: str, **kwargs) -> Dict[str, Any]:
     if not backup_path:
         return _err("backup_path is required")
 
-    if db_path == ":memory:":
+    if _is_memory(db_path):
         return _err("Cannot backup in-memory database")
 
-    source_path = Path(db_path).expanduser()
+    source_path = _db_file_path(db_path)
     if not source_path.exists():
         return _err(f"Database not found: {db_path}")
 
@@ -839,6 +901,7 @@ def _backup(db_path: str, backup_path: str, **kwargs) -> Dict[str, Any]:
 
 _ACTIONS = {
     "execute": _execute,
+    "execute_script": _execute_script,
     "query": _query,
     "create_table": _create_table,
     "drop_table": _drop_table,
@@ -895,6 +958,7 @@ def sqlite(
     Args:
         action: The action to perform. One of:
             - "execute": Execute a SQL statement (INSERT, UPDATE, DELETE, CREATE, etc.)
+            - "execute_script": Execute several ;-separated SQL statements in one call
             - "query": Execute a SELECT query and return results
             - "create_table": Create a new table
             - "drop_table": Drop a table
@@ -912,8 +976,8 @@ def sqlite(
             - "truncate": Delete all rows from a table (requires confirm=True)
             - "export_csv": Export a table to a CSV file
             - "import_csv": Import a CSV file into a table
-        db_path: Path to database file, or ":memory:" for in-memory database.
-        sql: SQL statement for execute/query actions.
+        db_path: Path to database file, ":memory:" for in-memory database, or a SQLite "file:" URI.
+        sql: SQL statement for execute/query actions (or a script for execute_script).
         params: Parameters for SQL statement (list or dict).
         table: Table name for table operations.
         columns: Dict of column_name: type for create_table (TEXT, INTEGER, REAL, BLOB).
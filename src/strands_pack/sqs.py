@@ -13,19 +13,22 @@ Actions
 - get_queue_url: Get queue URL from queue name
 - get_queue_attributes: Get queue configuration and stats
 - send: Send a message to a queue
-- send_batch: Send multiple messages (up to 10)
+- send_batch: Send multiple messages (batched 10 per request)
 - receive: Receive messages from a queue
 - delete_message: Delete a single message
-- delete_message_batch: Delete multiple messages
+- delete_message_batch: Delete multiple messages (batched 10 per request)
 - purge: Delete all messages from a queue
 - change_visibility: Change message visibility timeout
 """
 
-import json
-from typing import Any, Dict, List, Optional
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 
 from strands import tool
 
+from strands_pack.aws_clients import aws_client
 from strands_pack.aws_tags import aws_tags_dict
 
 try:
@@ -37,10 +40,49 @@ except ImportError:  # pragma: no cover
     HAS_BOTO3 = False
 
 
+# SendMessageBatch / DeleteMessageBatch accept at most this many entries per request
+_BATCH_LIMIT = 10
+
+# Longest single ReceiveMessage long poll SQS allows
+_MAX_LONG_POLL_SECONDS = 20
+
+# Upper bound on batch requests in flight at once (matches botocore's default connection pool size)
+_BATCH_MAX_WORKERS = 10
+
+# Attributes reported by get_queue_attributes; "All" would also pull Policy, RedrivePolicy, etc.
+_QUEUE_ATTRIBUTE_NAMES = (
+    "ApproximateNumberOfMessages",
+    "ApproximateNumberOfMessagesNotVisible",
+    "ApproximateNumberOfMessagesDelayed",
+    "VisibilityTimeout",
+    "MessageRetentionPeriod",
+    "CreatedTimestamp",
+    "LastModifiedTimestamp",
+    "QueueArn",
+)
+
+
 def _get_client():
+    """Return the shared SQS client so calls reuse its endpoint setup and connection pool."""
     if not HAS_BOTO3:
         raise ImportError("boto3 not installed. Run: pip install strands-pack[aws]")
-    return boto3.client("sqs")
+    return aws_client("sqs")
+
+
+def _batches(items: List[Any]):
+    """Yield (offset, chunk) pairs of at most _BATCH_LIMIT items."""
+    for start in range(0, len(items), _BATCH_LIMIT):
+        yield start, items[start:start + _BATCH_LIMIT]
+
+
+def _map_batches(call: Callable[[int, List[Any]], Any], items: List[Any]) -> List[Any]:
+    """Run call(offset, chunk) for each batch of items, in order; several batches go out concurrently."""
+    chunks = list(_batches(items))
+    if len(chunks) <= 1:
+        return [call(start, chunk) for start, chunk in chunks]
+    # Network-bound calls release the GIL, so threads overlap the round trips
+    with ThreadPoolExecutor(max_workers=min(_BATCH_MAX_WORKERS, len(chunks))) as pool:
+        return list(pool.map(lambda args: call(*args), chunks))
 
 
 def _ok(**data: Any) -> Dict[str, Any]:
@@ -88,10 +130,10 @@ def sqs(
             - "get_queue_url": Get queue URL from queue name.
             - "get_queue_attributes": Get queue configuration and stats.
             - "send": Send a message to a queue.
-            - "send_batch": Send multiple messages (up to 10).
+            - "send_batch": Send multiple messages (sent 10 per request).
             - "receive": Receive messages from a queue.
             - "delete_message": Delete a single message.
-            - "delete_message_batch": Delete multiple messages.
+            - "delete_message_batch": Delete multiple messages (sent 10 per request).
             - "purge": Delete all messages from a queue.
             - "change_visibility": Change message visibility timeout.
         queue_name: Name for the queue (create_queue, get_queue_url).
@@ -103,7 +145,8 @@ def sqs(
         message_attributes: Message attributes dict.
         max_messages: Max messages to receive (1-10, default 1).
         visibility_timeout: Visibility timeout in seconds (default 30).
-        wait_time_seconds: Long polling wait time (0-20, default 0).
+        wait_time_seconds: Seconds to wait for messages (default 0). Up to 20 is one long poll;
+            longer waits repeat long polls until a message arrives or the time is up.
         receipt_handle: Receipt handle for delete_message/change_visibility.
         receipt_handles: List of receipt handles for delete_message_batch.
         message_retention_period: Message retention in seconds (60-1209600, default 4 days).
@@ -167,15 +210,15 @@ def sqs(
             return _ok(queue_url=queue_url, deleted=True)
 
         if action == "list_queues":
-            list_args: Dict[str, Any] = {}
+            # SQS only returns NextToken when MaxResults is set, so give the paginator a page
+            # size; otherwise accounts with more than 1000 queues are silently truncated
+            list_args: Dict[str, Any] = {"PaginationConfig": {"PageSize": 1000}}
             if queue_name_prefix:
                 list_args["QueueNamePrefix"] = queue_name_prefix
-            resp = client.list_queues(**list_args)
-            queue_urls = resp.get("QueueUrls", []) or []
             queues = []
-            for url in queue_urls:
-                name = url.split("/")[-1]
-                queues.append({"name": name, "url": url})
+            for page in client.get_paginator("list_queues").paginate(**list_args):
+                for url in page.get("QueueUrls", []) or []:
+                    queues.append({"name": url.rpartition("/")[2], "url": url})
             return _ok(queues=queues, count=len(queues))
 
         if action == "get_queue_url":
@@ -187,8 +230,9 @@ def sqs(
         if action == "get_queue_attributes":
             if not queue_url:
                 return _err("queue_url is required")
-            resp = client.get_queue_attributes(QueueUrl=queue_url, AttributeNames=["All"])
+            resp = client.get_queue_attributes(QueueUrl=queue_url, AttributeNames=list(_QUEUE_ATTRIBUTE_NAMES))
             attrs = resp.get("Attributes", {}) or {}
+            queue_arn = attrs.get("QueueArn")
             return _ok(
                 queue_url=queue_url,
                 approximate_messages=int(attrs.get("ApproximateNumberOfMessages", 0)),
@@ -198,8 +242,9 @@ def sqs(
                 message_retention_period=int(attrs.get("MessageRetentionPeriod", 345600)),
                 created_timestamp=attrs.get("CreatedTimestamp"),
                 last_modified_timestamp=attrs.get("LastModifiedTimestamp"),
-                queue_arn=attrs.get("QueueArn"),
-                fifo_queue=attrs.get("FifoQueue") == "true",
+                queue_arn=queue_arn,
+                # FIFO queue names must end in .fifo, and FifoQueue is only valid to request on FIFO queues
+                fifo_queue=(queue_arn or queue_url).endswith(".fifo"),
             )
 
         if action == "send":
@@ -228,8 +273,6 @@ def sqs(
                 return _err("queue_url is required")
             if not messages or not isinstance(messages, list):
                 return _err("messages is required (list of dicts with 'body' key)")
-            if len(messages) > 10:
-                return _err("send_batch supports up to 10 messages", error_type="LimitExceeded")
             entries = []
             for i, msg in enumerate(messages):
                 if not isinstance(msg, dict) or "body" not in msg:
@@ -241,9 +284,14 @@ def sqs(
                 if msg.get("delay_seconds"):
                     entry["DelaySeconds"] = min(int(msg["delay_seconds"]), 900)
                 entries.append(entry)
-            resp = client.send_message_batch(QueueUrl=queue_url, Entries=entries)
-            successful = resp.get("Successful", []) or []
-            failed = resp.get("Failed", []) or []
+            # One SendMessageBatch request per 10 entries
+            successful: List[Dict[str, Any]] = []
+            failed: List[Dict[str, Any]] = []
+            for resp in _map_batches(
+                lambda _start, chunk: client.send_message_batch(QueueUrl=queue_url, Entries=chunk), entries
+            ):
+                successful.extend(resp.get("Successful", []) or [])
+                failed.extend(resp.get("Failed", []) or [])
             return _ok(
                 queue_url=queue_url,
                 successful_count=len(successful),
@@ -255,24 +303,35 @@ def sqs(
         if action == "receive":
             if not queue_url:
                 return _err("queue_url is required")
-            resp = client.receive_message(
-                QueueUrl=queue_url,
-                MaxNumberOfMessages=min(max(max_messages, 1), 10),
-                VisibilityTimeout=visibility_timeout,
-                WaitTimeSeconds=min(max(wait_time_seconds, 0), 20),
-                AttributeNames=["All"],
-                MessageAttributeNames=["All"],
-            )
-            msgs = resp.get("Messages", []) or []
-            formatted = []
-            for m in msgs:
-                formatted.append({
+            # Waits longer than one long poll become consecutive polls that stop at the
+            # first non-empty response or once the caller's wait budget is spent.
+            deadline = time.monotonic() + max(wait_time_seconds, 0)
+            while True:
+                # Round up so a 1 s wait stays a long poll rather than becoming WaitTimeSeconds=0
+                remaining = math.ceil(deadline - time.monotonic())
+                resp = client.receive_message(
+                    QueueUrl=queue_url,
+                    MaxNumberOfMessages=min(max(max_messages, 1), 10),
+                    VisibilityTimeout=visibility_timeout,
+                    WaitTimeSeconds=min(max(remaining, 0), _MAX_LONG_POLL_SECONDS),
+                    # Unlike get_queue_attributes, every system attribute is part of the result:
+                    # each message's Attributes dict is returned to the caller as-is
+                    AttributeNames=["All"],
+                    MessageAttributeNames=["All"],
+                )
+                msgs = resp.get("Messages", []) or []
+                if msgs or remaining <= _MAX_LONG_POLL_SECONDS:
+                    break
+            formatted = [
+                {
                     "message_id": m.get("MessageId"),
                     "receipt_handle": m.get("ReceiptHandle"),
                     "body": m.get("Body"),
                     "attributes": m.get("Attributes", {}),
                     "message_attributes": m.get("MessageAttributes", {}),
-                })
+                }
+                for m in msgs
+            ]
             return _ok(
                 queue_url=queue_url,
                 messages=formatted,
@@ -292,16 +351,21 @@ def sqs(
                 return _err("queue_url is required")
             if not receipt_handles or not isinstance(receipt_handles, list):
                 return _err("receipt_handles is required (list)")
-            if len(receipt_handles) > 10:
-                return _err("delete_message_batch supports up to 10 messages", error_type="LimitExceeded")
-            entries = [{"Id": str(i), "ReceiptHandle": rh} for i, rh in enumerate(receipt_handles)]
-            resp = client.delete_message_batch(QueueUrl=queue_url, Entries=entries)
-            successful = resp.get("Successful", []) or []
-            failed = resp.get("Failed", []) or []
+            # One DeleteMessageBatch request per 10 handles; Ids index into receipt_handles
+            def delete_chunk(start: int, chunk: List[str]) -> Dict[str, Any]:
+                entries = [{"Id": str(start + i), "ReceiptHandle": rh} for i, rh in enumerate(chunk)]
+                return client.delete_message_batch(QueueUrl=queue_url, Entries=entries)
+
+            deleted_count = 0
+            failed: List[Dict[str, Any]] = []
+            for resp in _map_batches(delete_chunk, receipt_handles):
+                deleted_count += len(resp.get("Successful", []) or [])
+                failed.extend(resp.get("Failed", []) or [])
             return _ok(
                 queue_url=queue_url,
-                deleted_count=len(successful),
+                deleted_count=deleted_count,
                 failed_count=len(failed),
+                failed=[{"id": f.get("Id"), "code": f.get("Code"), "message": f.get("Message")} for f in failed],
             )
 
         if action == "purge":
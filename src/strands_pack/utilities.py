@@ -31,13 +31,67 @@ Usage Examples:
 """
 
 import json
+import math
 import os
 import re
+import stat
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
 from strands import tool
 
+try:
+    # Linear-time DFA engine for scanning large texts (pip install strands-pack[re2])
+    import re2 as _url_re_engine
+    HAS_RE2 = True
+except ImportError:
+    _url_re_engine = re
+    HAS_RE2 = False
+
+try:
+    # C JSON codec for save_json/load_json (pip install strands-pack[orjson])
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Groups capture local part and domain so validate_email needn't re-split the address
+_EMAIL_RE = re.compile(r'^([a-zA-Z0-9._%+-]+)@([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})$')
+# Everything Python's re counts as \s, spelled out: re2's \s is ASCII-only and skips \v,
+# so an explicit class keeps extract_urls identical with and without the re2 extra
+_URL_WHITESPACE = "\t\n\v\f\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+_URL_PATTERN = "https?://[^" + _URL_WHITESPACE + r'<>"{}|\\^`\[\]]+'
+_URL_RE = _url_re_engine.compile(_URL_PATTERN)
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_NON_BLANK_LINE_RE = re.compile(r'^[^\S\n]*\S', re.MULTILINE)
+
+_READ_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Cheap pre-parse sniff for load_json: ASCII bytes a JSON document may start with
+# (NaN/Infinity included because the stdlib parser accepts them)
+_JSON_LEADING_WS_RE = re.compile(rb'[ \t\r\n]*')
+_JSON_START_BYTES = frozenset(b'{["-0123456789tfnNI')
+
+# orjson turns integers outside the 64-bit range into floats; input with any 19+ digit run goes to json
+_JSON_LONG_DIGITS_RE = re.compile(r'[0-9]{19}')
+_JSON_LONG_DIGITS_BYTES_RE = re.compile(rb'[0-9]{19}')
+
+_DEFAULT_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Fallback formats tried (in order) when a timestamp isn't ISO 8601
+_TIMESTAMP_FORMATS = (
+    _DEFAULT_TIMESTAMP_FORMAT,
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+)
+
+_ENV = os.environ
+_MISSING = object()
+
 
 @tool
 def validate_email(email: str) -> dict:
@@ -50,19 +104,15 @@ def validate_email(email: str) -> dict:
     Returns:
         dict with validation result and details.
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-
-    is_valid = bool(re.match(pattern, email))
+    match = _EMAIL_RE.match(email)
 
     result = {
         "email": email,
-        "is_valid": is_valid,
+        "is_valid": match is not None,
     }
 
-    if is_valid:
-        parts = email.split("@")
-        result["local_part"] = parts[0]
-        result["domain"] = parts[1]
+    if match:
+        result["local_part"], result["domain"] = match.groups()
     else:
         result["error"] = "Invalid email format"
 
@@ -83,24 +133,51 @@ def count_lines_in_file(file_path: str) -> dict:
     try:
         path = Path(file_path)
 
-        if not path.exists():
+        # One stat() answers exists / is-file / size
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return {"success": False, "error": f"File not found: {file_path}"}
 
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return {"success": False, "error": f"Not a file: {file_path}"}
 
-        with open(path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-
-        non_empty_lines = [l for l in lines if l.strip()]
+        # Stream fixed-size chunks so memory stays flat regardless of file or line length.
+        # A line spanning chunks is tracked only as "seen any chars / any non-blank char".
+        total_lines = 0
+        non_empty_lines = 0
+        in_line = False
+        line_has_text = False
+        if st.st_size:  # empty files need no open()/read()
+            with open(path, "r", encoding="utf-8") as f:
+                while chunk := f.read(_READ_CHUNK_SIZE):
+                    first = chunk.find("\n")
+                    if first == -1:
+                        in_line = True
+                        line_has_text = line_has_text or bool(_NON_BLANK_LINE_RE.match(chunk))
+                        continue
+                    # Finish the line carried in from earlier chunks
+                    if line_has_text or _NON_BLANK_LINE_RE.match(chunk, 0, first):
+                        non_empty_lines += 1
+                    total_lines += chunk.count("\n")
+                    last = chunk.rfind("\n")
+                    non_empty_lines += len(_NON_BLANK_LINE_RE.findall(chunk, first + 1, last + 1))
+                    # Start the line that continues into the next chunk
+                    in_line = last + 1 < len(chunk)
+                    line_has_text = bool(_NON_BLANK_LINE_RE.match(chunk, last + 1))
+
+        if in_line:
+            total_lines += 1
+            if line_has_text:
+                non_empty_lines += 1
 
         return {
             "success": True,
             "file_path": str(path.absolute()),
-            "total_lines": len(lines),
-            "non_empty_lines": len(non_empty_lines),
-            "empty_lines": len(lines) - len(non_empty_lines),
-            "file_size_bytes": path.stat().st_size,
+            "total_lines": total_lines,
+            "non_empty_lines": non_empty_lines,
+            "empty_lines": total_lines - non_empty_lines,
+            "file_size_bytes": st.st_size,
         }
 
     except UnicodeDecodeError:
@@ -136,62 +213,152 @@ def divide_numbers(numerator: float, denominator: float) -> dict:
         "result": result,
         "numerator": numerator,
         "denominator": denominator,
-        "is_integer": result == int(result),
+        "is_integer": float(result).is_integer(),
     }
 
 
 @tool
-def save_json(data: dict, file_path: str, pretty: bool = True) -> dict:
+def save_json(data: dict, file_path: str = None, pretty: bool = True) -> dict:
     """
-    Save data to a JSON file.
+    Save data to a JSON file, or serialize it in memory.
 
     Args:
         data: Dictionary data to save.
-        file_path: Output file path.
+        file_path: Output file path. If None, nothing is written and the
+            serialized document is returned under "json".
         pretty: Whether to format JSON with indentation.
 
     Returns:
-        dict with success status and file info.
+        dict with success status and file info (or the JSON text).
     """
     try:
+        payload = _dumps_json(data, pretty)
+
+        if file_path is None:
+            return {
+                "success": True,
+                "json": payload.decode("utf-8"),
+                "size_bytes": len(payload),
+            }
+
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w", encoding="utf-8") as f:
-            if pretty:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(data, f, ensure_ascii=False)
+        # Write the in-memory payload once rather than streaming small writes
+        path.write_bytes(payload)
 
         return {
             "success": True,
             "file_path": str(path.absolute()),
-            "size_bytes": path.stat().st_size,
+            "size_bytes": len(payload),
         }
 
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+# orjson refuses deeper nesting; anything past it is left to json
+_ORJSON_MAX_DEPTH = 254
+
+
+def _is_orjson_scalar(value) -> bool:
+    """True for scalars orjson writes exactly like json.dumps: no NaN/Infinity, no ints past 64 bits."""
+    if value is None or isinstance(value, (str, bool)):
+        return True
+    if isinstance(value, int):
+        return -(1 << 63) <= value < (1 << 64)
+    if isinstance(value, float):
+        return math.isfinite(value)
+    return False
+
+
+def _is_orjson_safe(value, depth: int = 0) -> bool:
+    """True if value holds only plain JSON types that orjson encodes exactly like json.dumps.
+
+    orjson writes NaN as null and natively encodes datetime, UUID, dataclasses and
+    enums that json.dumps rejects, so anything else goes through json.
+    """
+    if isinstance(value, (list, tuple)):
+        return depth < _ORJSON_MAX_DEPTH and all(_is_orjson_safe(v, depth + 1) for v in value)
+    if isinstance(value, dict):
+        return depth < _ORJSON_MAX_DEPTH and all(
+            _is_orjson_scalar(k) and _is_orjson_safe(v, depth + 1) for k, v in value.items()
+        )
+    return _is_orjson_scalar(value)
+
+
+def _dumps_json(data, pretty: bool) -> bytes:
+    """Serialize data to UTF-8 bytes exactly as json.dumps(indent=2 if pretty else None) would."""
+    if HAS_ORJSON and pretty and _is_orjson_safe(data):
+        # orjson's compact form drops the spaces json.dumps puts after "," and ":", so only
+        # indented output goes through it
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates; json reports its own error
+    indent = 2 if pretty else None
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_json(raw):
+    """Parse JSON text (str or bytes) with the same result or error as json.loads."""
+    if HAS_ORJSON:
+        long_digits = _JSON_LONG_DIGITS_RE if isinstance(raw, str) else _JSON_LONG_DIGITS_BYTES_RE
+        if not long_digits.search(raw):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity, out-of-range floats and real errors are left to json
+    return json.loads(raw)
+
+
+def _json_sniff_error(raw: bytes):
+    """Return an error if raw obviously isn't JSON, without running the parser.
+
+    Only ASCII lead bytes are judged; BOMs and UTF-16/32 input are left to the parser.
+    """
+    pos = _JSON_LEADING_WS_RE.match(raw).end()
+    if pos < len(raw):
+        lead = raw[pos]
+        if 0 < lead < 0x80 and lead not in _JSON_START_BYTES:
+            return f"Invalid JSON: unexpected character {chr(lead)!r} at position {pos}"
+    return None
+
+
 @tool
-def load_json(file_path: str) -> dict:
+def load_json(file_path: str = None, content: str = None) -> dict:
     """
-    Load data from a JSON file.
+    Load data from a JSON file or parse a JSON document directly.
 
     Args:
         file_path: Path to JSON file.
+        content: JSON text (str or bytes) to parse instead of reading a file.
 
     Returns:
         dict with success status and loaded data.
     """
     try:
+        if content is not None:
+            if isinstance(content, (bytes, bytearray)):
+                error = _json_sniff_error(content)
+                if error:
+                    return {"success": False, "error": error}
+            data = _loads_json(content)
+            return {"success": True, "data": data}
+
+        if file_path is None:
+            return {"success": False, "error": "file_path or content is required"}
+
         path = Path(file_path)
 
         if not path.exists():
             return {"success": False, "error": f"File not found: {file_path}"}
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        raw = path.read_bytes()
+        error = _json_sniff_error(raw)
+        if error:
+            return {"success": False, "error": error}
+        data = _loads_json(raw)
 
         return {
             "success": True,
@@ -217,21 +384,35 @@ def get_env_variable(name: str, default: str = None) -> dict:
     Returns:
         dict with variable name and value.
     """
-    value = os.environ.get(name, default)
+    # Single lookup: the sentinel tells "unset" apart from any real value
+    value = _ENV.get(name, _MISSING)
+    is_set = value is not _MISSING
 
     return {
         "name": name,
-        "value": value,
-        "is_set": name in os.environ,
-        "using_default": name not in os.environ and default is not None,
+        "value": value if is_set else default,
+        "is_set": is_set,
+        "using_default": not is_set and default is not None,
     }
 
 
+def _parse_iso_timestamp(value: str):
+    """Parse an ISO 8601 timestamp with the C fromisoformat, or return None.
+
+    A trailing "Z" is dropped so the result stays naive, matching the
+    "%Y-%m-%dT%H:%M:%SZ" strptime fallback.
+    """
+    try:
+        return datetime.fromisoformat(value.removesuffix("Z"))
+    except ValueError:
+        return None
+
+
 @tool
 def format_timestamp(
     timestamp: str = None,
     input_format: str = None,
-    output_format: str = "%Y-%m-%d %H:%M:%S",
+    output_format: str = _DEFAULT_TIMESTAMP_FORMAT,
 ) -> dict:
     """
     Format a timestamp or get the current time.
@@ -251,22 +432,15 @@ def format_timestamp(
             if input_format:
                 dt = datetime.strptime(timestamp, input_format)
             else:
-                # Try common formats
-                formats = [
-                    "%Y-%m-%d %H:%M:%S",
-                    "%Y-%m-%dT%H:%M:%S",
-                    "%Y-%m-%dT%H:%M:%SZ",
-                    "%Y-%m-%d",
-                    "%d/%m/%Y",
-                    "%m/%d/%Y",
-                ]
-                dt = None
-                for fmt in formats:
-                    try:
-                        dt = datetime.strptime(timestamp, fmt)
-                        break
-                    except ValueError:
-                        continue
+                dt = _parse_iso_timestamp(timestamp)
+                if dt is None:
+                    # Try common formats
+                    for fmt in _TIMESTAMP_FORMATS:
+                        try:
+                            dt = datetime.strptime(timestamp, fmt)
+                            break
+                        except ValueError:
+                            continue
 
                 if dt is None:
                     return {
@@ -301,26 +475,11 @@ def extract_urls(text: str) -> dict:
     Returns:
         dict with list of found URLs.
     """
-    # URL pattern matching http, https, and www
-    pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-
-    urls = re.findall(pattern, text)
-
     # Clean up URLs (remove trailing punctuation)
-    cleaned = []
-    for url in urls:
-        while url and url[-1] in ".,;:!?)":
-            url = url[:-1]
-        if url:
-            cleaned.append(url)
+    cleaned = (url.rstrip(".,;:!?)") for url in _URL_RE.findall(text))
 
     # Deduplicate while preserving order
-    seen = set()
-    unique = []
-    for url in cleaned:
-        if url not in seen:
-            seen.add(url)
-            unique.append(url)
+    unique = list(dict.fromkeys(url for url in cleaned if url))
 
     return {
         "success": True,
@@ -342,7 +501,7 @@ def word_count(text: str, include_details: bool = False) -> dict:
         dict with word count and optional details.
     """
     words = text.split()
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
 
     result = {
@@ -354,17 +513,11 @@ def word_count(text: str, include_details: bool = False) -> dict:
 
     if include_details:
         # Word frequency
-        word_freq = {}
-        for word in words:
-            word_lower = word.lower().strip(".,!?;:")
-            if word_lower:
-                word_freq[word_lower] = word_freq.get(word_lower, 0) + 1
-
-        # Top 10 words
-        top_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10]
+        normalized = (word.lower().strip(".,!?;:") for word in words)
+        word_freq = Counter(word for word in normalized if word)
 
         result["avg_word_length"] = sum(len(w) for w in words) / len(words) if words else 0
         result["avg_sentence_length"] = len(words) / len(sentences) if sentences else 0
-        result["top_words"] = dict(top_words)
+        result["top_words"] = dict(word_freq.most_common(10))
 
     return result
@@ -42,23 +42,29 @@ Notes:
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from strands import tool
 
-# Lazy import for requests
-_requests = None
+# Lazily created shared session (connection pooling across calls)
+_session = None
 
 
 def _get_requests():
-    global _requests
-    if _requests is None:
+    """Return a shared requests.Session so repeated calls reuse TCP/TLS connections."""
+    global _session
+    if _session is None:
         try:
             import requests
-            _requests = requests
+            from requests.adapters import HTTPAdapter
         except ImportError:
             raise ImportError("requests not installed. Run: pip install strands-pack[x]") from None
-    return _requests
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        _session = session
+    return _session
 
 
 def _get_token():
@@ -68,20 +74,45 @@ def _get_token():
     return token
 
 
-def _get_headers():
-    return {
-        "Authorization": f"Bearer {_get_token()}",
+@lru_cache(maxsize=4)
+def _headers_for(token: str) -> Mapping[str, str]:
+    # Keyed on the token itself, so rotating X_BEARER_TOKEN is picked up on the next call
+    return MappingProxyType({
+        "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
-    }
+    })
+
+
+def _get_headers():
+    return _headers_for(_get_token())
 
 
 BASE_URL = "https://api.twitter.com/2"
 
+_AT_STRIP = str.maketrans("", "", "@")
+
+# Endpoint templates (fill with str.format)
+_URL_USER_BY_USERNAME = BASE_URL + "/users/by/username/{}"
+_URL_USER = BASE_URL + "/users/{}"
+_URL_USER_TWEETS = BASE_URL + "/users/{}/tweets"
+_URL_TWEET = BASE_URL + "/tweets/{}"
+_URL_SEARCH_RECENT = BASE_URL + "/tweets/search/recent"
+_URL_USER_MENTIONS = BASE_URL + "/users/{}/mentions"
+_URL_USER_FOLLOWERS = BASE_URL + "/users/{}/followers"
+_URL_USER_FOLLOWING = BASE_URL + "/users/{}/following"
+_URL_LIKING_USERS = BASE_URL + "/tweets/{}/liking_users"
+_URL_RETWEETED_BY = BASE_URL + "/tweets/{}/retweeted_by"
+
 # Standard fields to request
 USER_FIELDS = "created_at,description,location,profile_image_url,public_metrics,url,verified"
 TWEET_FIELDS = "author_id,created_at,conversation_id,public_metrics,possibly_sensitive,lang,source,reply_settings"
 
 
+def _api_get(url: str, params: Dict[str, Any]):
+    """GET an X API endpoint on the shared session with auth headers."""
+    return _get_requests().get(url, headers=_get_headers(), params=params, timeout=30)
+
+
 def _ok(**data: Any) -> Dict[str, Any]:
     out: Dict[str, Any] = {"success": True}
     out.update(data)
@@ -155,17 +186,10 @@ def _get_user(username: str, **kwargs) -> Dict[str, Any]:
     if not username:
         return _err("username is required")
 
-    # Remove @ if present
-    username = username.lstrip("@")
-
-    requests = _get_requests()
+    # Remove @ if present (X handles can't contain one, so drop them all)
+    username = username.translate(_AT_STRIP)
 
-    response = requests.get(
-        f"{BASE_URL}/users/by/username/{username}",
-        headers=_get_headers(),
-        params={"user.fields": USER_FIELDS},
-        timeout=30,
-    )
+    response = _api_get(_URL_USER_BY_USERNAME.format(username), params={"user.fields": USER_FIELDS})
 
     data, error = _handle_response(response)
     if error:
@@ -185,14 +209,7 @@ def _get_user_by_id(user_id: str, **kwargs) -> Dict[str, Any]:
     if not user_id:
         return _err("user_id is required")
 
-    requests = _get_requests()
-
-    response = requests.get(
-        f"{BASE_URL}/users/{user_id}",
-        headers=_get_headers(),
-        params={"user.fields": USER_FIELDS},
-        timeout=30,
-    )
+    response = _api_get(_URL_USER.format(user_id), params={"user.fields": USER_FIELDS})
 
     data, error = _handle_response(response)
     if error:
@@ -213,8 +230,6 @@ def _get_user_tweets(user_id: str, max_results: int = 10, exclude: Optional[List
     if not user_id:
         return _err("user_id is required")
 
-    requests = _get_requests()
-
     max_results = min(max(int(max_results), 5), 100)  # API limits: 5-100
 
     params = {
@@ -224,12 +239,7 @@ def _get_user_tweets(user_id: str, max_results: int = 10, exclude: Optional[List
     if exclude:
         params["exclude"] = ",".join(exclude) if isinstance(exclude, list) else exclude
 
-    response = requests.get(
-        f"{BASE_URL}/users/{user_id}/tweets",
-        headers=_get_headers(),
-        params=params,
-        timeout=30,
-    )
+    response = _api_get(_URL_USER_TWEETS.format(user_id), params=params)
 
     data, error = _handle_response(response)
     if error:
@@ -252,18 +262,11 @@ def _get_tweet(tweet_id: str, expansions: Optional[List[str]] = None, **kwargs)
     if not tweet_id:
         return _err("tweet_id is required")
 
-    requests = _get_requests()
-
     params = {"tweet.fields": TWEET_FIELDS}
     if expansions:
         params["expansions"] = ",".join(expansions) if isinstance(expansions, list) else expansions
 
-    response = requests.get(
-        f"{BASE_URL}/tweets/{tweet_id}",
-        headers=_get_headers(),
-        params=params,
-        timeout=30,
-    )
+    response = _api_get(_URL_TWEET.format(tweet_id), params=params)
 
     data, error = _handle_response(response)
     if error:
@@ -284,8 +287,6 @@ def _search_recent(query: str, max_results: int = 10, start_time: Optional[str]
     if not query:
         return _err("query is required")
 
-    requests = _get_requests()
-
     max_results = min(max(int(max_results), 10), 100)  # API limits: 10-100
 
     params = {
@@ -298,12 +299,7 @@ def _search_recent(query: str, max_results: int = 10, start_time: Optional[str]
     if end_time:
         params["end_time"] = end_time
 
-    response = requests.get(
-        f"{BASE_URL}/tweets/search/recent",
-        headers=_get_headers(),
-        params=params,
-        timeout=30,
-    )
+    response = _api_get(_URL_SEARCH_RECENT, params=params)
 
     data, error = _handle_response(response)
     if error:
@@ -326,19 +322,12 @@ def _get_user_mentions(user_id: str, max_results: int = 10, **kwargs) -> Dict[st
     if not user_id:
         return _err("user_id is required")
 
-    requests = _get_requests()
-
     max_results = min(max(int(max_results), 5), 100)  # API limits: 5-100
 
-    response = requests.get(
-        f"{BASE_URL}/users/{user_id}/mentions",
-        headers=_get_headers(),
-        params={
-            "max_results": max_results,
-            "tweet.fields": TWEET_FIELDS,
-        },
-        timeout=30,
-    )
+    response = _api_get(_URL_USER_MENTIONS.format(user_id), params={
+        "max_results": max_results,
+        "tweet.fields": TWEET_FIELDS,
+    })
 
     data, error = _handle_response(response)
     if error:
@@ -361,19 +350,12 @@ def _get_user_followers(user_id: str, max_results: int = 100, **kwargs) -> Dict[
     if not user_id:
         return _err("user_id is required")
 
-    requests = _get_requests()
-
     max_results = min(max(int(max_results), 1), 1000)
 
-    response = requests.get(
-        f"{BASE_URL}/users/{user_id}/followers",
-        headers=_get_headers(),
-        params={
-            "max_results": max_results,
-            "user.fields": USER_FIELDS,
-        },
-        timeout=30,
-    )
+    response = _api_get(_URL_USER_FOLLOWERS.format(user_id), params={
+        "max_results": max_results,
+        "user.fields": USER_FIELDS,
+    })
 
     data, error = _handle_response(response)
     if error:
@@ -396,19 +378,12 @@ def _get_user_following(user_id: str, max_results: int = 100, **kwargs) -> Dict[
     if not user_id:
         return _err("user_id is required")
 
-    requests = _get_requests()
-
     max_results = min(max(int(max_results), 1), 1000)
 
-    response = requests.get(
-        f"{BASE_URL}/users/{user_id}/following",
-        headers=_get_headers(),
-        params={
-            "max_results": max_results,
-            "user.fields": USER_FIELDS,
-        },
-        timeout=30,
-    )
+    response = _api_get(_URL_USER_FOLLOWING.format(user_id), params={
+        "max_results": max_results,
+        "user.fields": USER_FIELDS,
+    })
 
     data, error = _handle_response(response)
     if error:
@@ -431,19 +406,12 @@ def _get_liking_users(tweet_id: str, max_results: int = 100, **kwargs) -> Dict[s
     if not tweet_id:
         return _err("tweet_id is required")
 
-    requests = _get_requests()
-
     max_results = min(max(int(max_results), 1), 100)
 
-    response = requests.get(
-        f"{BASE_URL}/tweets/{tweet_id}/liking_users",
-        headers=_get_headers(),
-        params={
-            "max_results": max_results,
-            "user.fields": USER_FIELDS,
-        },
-        timeout=30,
-    )
+    response = _api_get(_URL_LIKING_USERS.format(tweet_id), params={
+        "max_results": max_results,
+        "user.fields": USER_FIELDS,
+    })
 
     data, error = _handle_response(response)
     if error:
@@ -466,19 +434,12 @@ def _get_retweeters(tweet_id: str, max_results: int = 100, **kwargs) -> Dict[str
     if not tweet_id:
         return _err("tweet_id is required")
 
-    requests = _get_requests()
-
     max_results = min(max(int(max_results), 1), 100)
 
-    response = requests.get(
-        f"{BASE_URL}/tweets/{tweet_id}/retweeted_by",
-        headers=_get_headers(),
-        params={
-            "max_results": max_results,
-            "user.fields": USER_FIELDS,
-        },
-        timeout=30,
-    )
+    response = _api_get(_URL_RETWEETED_BY.format(tweet_id), params={
+        "max_results": max_results,
+        "user.fields": USER_FIELDS,
+    })
 
     data, error = _handle_response(response)
     if error:
@@ -571,11 +532,12 @@ def x(
     """
     action = (action or "").strip().lower()
 
-    if action not in _ACTIONS:
+    handler = _ACTIONS.get(action)
+    if handler is None:
         return _err(
             f"Unknown action: {action}",
             error_type="InvalidAction",
-            available_actions=list(_ACTIONS.keys()),
+            available_actions=list(_ACTIONS),
         )
 
     # Build kwargs dict from explicit parameters
@@ -600,7 +562,7 @@ def x(
         kwargs["end_time"] = end_time
 
     try:
-        return _ACTIONS[action](**kwargs)
+        return handler(**kwargs)
     except ImportError as e:
         return _err(str(e), error_type="ImportError")
     except ValueError as e:
@@ -38,6 +38,11 @@ Supported actions
       - start_index (optional int)
       - currency (optional str)
       - include_historical_channel_data (optional bool)
+- query_reports_batch
+    Runs several query_report requests concurrently (up to 8 at a time).
+    Parameters:
+      - reports (required): list of dicts, each taking the query_report parameters above
+    Returns one result per report, in order; a failing report does not fail the batch.
 
 Usage examples (Agent)
 ----------------------
@@ -59,7 +64,9 @@ Usage examples (Agent)
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Sequence, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from strands import tool
 
@@ -68,13 +75,18 @@ DEFAULT_SCOPES: List[str] = [
 ]
 
 try:
+    import google_auth_httplib2
     from googleapiclient.discovery import build as _google_build
+    from googleapiclient.http import HttpRequest, build_http
 
     HAS_YT_ANALYTICS = True
 except ImportError:  # pragma: no cover
     _google_build = None
     HAS_YT_ANALYTICS = False
 
+# Upper bound on concurrent reports.query calls for query_reports_batch
+_BATCH_MAX_WORKERS = 8
+
 
 def _csv(value: Union[str, Sequence[str], None]) -> Optional[str]:
     """Convert a string or list of strings to a comma-separated string."""
@@ -87,12 +99,109 @@ def _csv(value: Union[str, Sequence[str], None]) -> Optional[str]:
     return ",".join(items) if items else None
 
 
+def _nonempty(value: Optional[str]) -> Optional[str]:
+    """Treat empty strings as unset."""
+    return value or None
+
+
+# Optional query_report params: python kwarg -> (reports.query kwarg, coercer or None)
+_PARAM_MAP: Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]] = {
+    "dimensions": ("dimensions", _csv),
+    "filters": ("filters", _nonempty),
+    "sort": ("sort", _csv),
+    "max_results": ("maxResults", None),
+    "start_index": ("startIndex", None),
+    "currency": ("currency", _nonempty),
+    "include_historical_channel_data": ("includeHistoricalChannelData", None),
+}
+
+
+def _build_report_request(
+    ids: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    metrics: Union[str, Sequence[str], None],
+    **optional: Any,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Validate query_report params and map them to reports.query kwargs.
+
+    Returns (request, None) on success or (None, error_message).
+    """
+    if not start_date:
+        return None, "start_date is required (YYYY-MM-DD)"
+    if not end_date:
+        return None, "end_date is required (YYYY-MM-DD)"
+    metrics_csv = _csv(metrics)
+    if not metrics_csv:
+        return None, "metrics is required"
+
+    req: Dict[str, Any] = {
+        "ids": ids or "channel==MINE",
+        "startDate": start_date,
+        "endDate": end_date,
+        "metrics": metrics_csv,
+    }
+    for name, (api_name, coerce) in _PARAM_MAP.items():
+        value = optional.get(name)
+        if value is not None and coerce is not None:
+            value = coerce(value)
+        if value is not None:
+            req[api_name] = value
+    return req, None
+
+
+def _thread_local_request_builder(credentials: Any) -> Callable[..., Any]:
+    """Build requests on a per-thread authorized Http.
+
+    httplib2.Http is not thread-safe, so a cached service shared by the
+    query_reports_batch workers needs one connection per thread. build_http()
+    keeps googleapiclient's default timeout and redirect handling.
+    """
+    local = threading.local()
+
+    def build_request(http: Any, *args: Any, **kwargs: Any) -> Any:
+        thread_http = getattr(local, "http", None)
+        if thread_http is None:
+            thread_http = local.http = google_auth_httplib2.AuthorizedHttp(credentials, http=build_http())
+        return HttpRequest(thread_http, *args, **kwargs)
+
+    return build_request
+
+
+_SERVICE_CACHE: Dict[Tuple[Any, ...], Any] = {}
+
+
+def _credentials_key(creds: Any) -> Tuple[Any, ...]:
+    """Identify the grant behind a credentials object.
+
+    A new token file (re-auth, or GOOGLE_AUTHORIZED_USER_FILE pointing elsewhere)
+    or another service account/delegated user yields a different key.
+    """
+    return (
+        type(creds).__name__,
+        getattr(creds, "client_id", None),
+        getattr(creds, "refresh_token", None),
+        getattr(creds, "service_account_email", None),
+        getattr(creds, "_subject", None),
+    )
+
+
+def clear_service_cache() -> None:
+    """Drop cached YouTube Analytics services so the next call rebuilds them."""
+    _SERVICE_CACHE.clear()
+
+
 def _get_service(
     service_account_file: Optional[str] = None,
     authorized_user_file: Optional[str] = None,
     delegated_user: Optional[str] = None,
 ) -> Any:
-    """Get YouTube Analytics service using shared auth."""
+    """Get YouTube Analytics service using shared auth.
+
+    Credentials are resolved on every call; built services are cached per
+    credential grant so later calls skip discovery. The "auth needed" result
+    is not cached.
+    """
     from strands_pack.google_auth import get_credentials
 
     creds = get_credentials(
@@ -105,7 +214,49 @@ def _get_service(
     if creds is None:
         return None  # Auth needed
 
-    return _google_build("youtubeAnalytics", "v2", credentials=creds, cache_discovery=False)
+    key = _credentials_key(creds)
+    cached = _SERVICE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    service = _google_build(
+        "youtubeAnalytics",
+        "v2",
+        credentials=creds,
+        cache_discovery=False,
+        requestBuilder=_thread_local_request_builder(creds),
+    )
+    _SERVICE_CACHE[key] = service
+    return service
+
+
+def _run_query(service: Any, req: Dict[str, Any]) -> Dict[str, Any]:
+    resp = service.reports().query(**req).execute()
+    return _ok(
+        request=req,
+        response=resp,
+        column_headers=resp.get("columnHeaders", []),
+        rows=resp.get("rows", []),
+    )
+
+
+def _query_one(service: Any, report: Any) -> Dict[str, Any]:
+    """Run a single query_report spec; errors are returned, not raised."""
+    if not isinstance(report, dict):
+        return _err(f"Each report must be a dict of query_report parameters, got {type(report).__name__}")
+    req, error = _build_report_request(
+        report.get("ids"),
+        report.get("start_date"),
+        report.get("end_date"),
+        report.get("metrics"),
+        **{name: report.get(name) for name in _PARAM_MAP},
+    )
+    if error:
+        return _err(error)
+    try:
+        return _run_query(service, req)
+    except Exception as e:
+        return _err(str(e), request=req)
 
 
 def _ok(**data: Any) -> Dict[str, Any]:
@@ -134,6 +285,7 @@ def youtube_analytics(
     start_index: Optional[int] = None,
     currency: Optional[str] = None,
     include_historical_channel_data: Optional[bool] = None,
+    reports: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     """
     YouTube Analytics API tool for querying channel and video analytics.
@@ -141,6 +293,7 @@ def youtube_analytics(
     Args:
         action: The operation to perform. One of:
             - "query_report": Query analytics data
+            - "query_reports_batch": Run several query_report requests concurrently
         ids: Channel or content owner ID (default "channel==MINE")
         start_date: Start date in YYYY-MM-DD format (required for query_report)
         end_date: End date in YYYY-MM-DD format (required for query_report)
@@ -156,6 +309,8 @@ def youtube_analytics(
         start_index: Index of first result to return (optional)
         currency: Currency for revenue metrics (optional)
         include_historical_channel_data: Include data before channel linked (optional)
+        reports: List of query_report parameter dicts (required for query_reports_batch)
+            Example: [{"start_date": "2026-01-01", "end_date": "2026-01-07", "metrics": "views"}]
 
     Returns:
         dict with success status and relevant data
@@ -187,7 +342,7 @@ def youtube_analytics(
             "Missing YouTube Analytics dependencies. Install with: pip install strands-pack[youtube]"
         )
 
-    valid_actions = ["query_report"]
+    valid_actions = ["query_report", "query_reports_batch"]
     action = (action or "").strip()
     if action not in valid_actions:
         return _err(f"Unknown action: {action}", available_actions=valid_actions)
@@ -201,51 +356,36 @@ def youtube_analytics(
     try:
         # query_report
         if action == "query_report":
-            if not start_date:
-                return _err("start_date is required (YYYY-MM-DD)")
-            if not end_date:
-                return _err("end_date is required (YYYY-MM-DD)")
-            metrics_csv = _csv(metrics)
-            if not metrics_csv:
-                return _err("metrics is required")
-
-            req: Dict[str, Any] = {
-                "ids": ids or "channel==MINE",
-                "startDate": start_date,
-                "endDate": end_date,
-                "metrics": metrics_csv,
-            }
-
-            # Add optional parameters
-            dimensions_csv = _csv(dimensions)
-            if dimensions_csv:
-                req["dimensions"] = dimensions_csv
-
-            if filters:
-                req["filters"] = filters
-
-            sort_csv = _csv(sort)
-            if sort_csv:
-                req["sort"] = sort_csv
-
-            if max_results is not None:
-                req["maxResults"] = max_results
-
-            if start_index is not None:
-                req["startIndex"] = start_index
-
-            if currency:
-                req["currency"] = currency
-
-            if include_historical_channel_data is not None:
-                req["includeHistoricalChannelData"] = include_historical_channel_data
-
-            resp = service.reports().query(**req).execute()
+            req, error = _build_report_request(
+                ids,
+                start_date,
+                end_date,
+                metrics,
+                dimensions=dimensions,
+                filters=filters,
+                sort=sort,
+                max_results=max_results,
+                start_index=start_index,
+                currency=currency,
+                include_historical_channel_data=include_historical_channel_data,
+            )
+            if error:
+                return _err(error)
+
+            return _run_query(service, req)
+
+        if action == "query_reports_batch":
+            if not reports:
+                return _err("reports is required (list of query_report parameter dicts)")
+
+            # Network-bound calls release the GIL, so threads overlap the round trips
+            with ThreadPoolExecutor(max_workers=min(_BATCH_MAX_WORKERS, len(reports))) as pool:
+                results = list(pool.map(lambda report: _query_one(service, report), reports))
+
             return _ok(
-                request=req,
-                response=resp,
-                column_headers=resp.get("columnHeaders", []),
-                rows=resp.get("rows", []),
+                results=results,
+                count=len(results),
+                failed=sum(1 for r in results if not r["success"]),
             )
 
     except Exception as e:
@@ -0,0 +1,91 @@
+"""Shared pytest fixtures."""
+
+from functools import partial
+from importlib import import_module
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import tool modules and load the sqlite3 C extension once per session.
+
+    Keeps first-import cost out of whichever test happens to run first (and,
+    under pytest-xdist, front-loads it per worker).
+    """
+    import sqlite3
+
+    import strands_pack.sqlite  # noqa: F401
+    import strands_pack.twilio_tool  # noqa: F401
+
+    sqlite3.connect(":memory:").close()
+
+
+# Shared by negative-path tests that must never reach the API; checked and reset per use
+_IDLE_SERVICE = MagicMock()
+
+
+def _install_idle_service(monkeypatch, module_name: str, attr: str):
+    module = import_module(module_name)
+    monkeypatch.setattr(module, attr, lambda *args, **kwargs: _IDLE_SERVICE)
+    try:
+        yield _IDLE_SERVICE
+        assert not _IDLE_SERVICE.mock_calls, f"unexpected API calls: {_IDLE_SERVICE.mock_calls}"
+    finally:
+        _IDLE_SERVICE.reset_mock()
+
+
+@pytest.fixture
+def yt_idle_service(monkeypatch):
+    """Shared youtube_read service for tests that should fail before any API call."""
+    yield from _install_idle_service(monkeypatch, "strands_pack.youtube_read", "_get_service")
+
+
+@pytest.fixture
+def yt_write_idle_service(monkeypatch):
+    """Shared youtube_write service for tests that should fail before any API call."""
+    yield from _install_idle_service(monkeypatch, "strands_pack.youtube_write", "_get_write_service")
+
+
+@pytest.fixture
+def yt_analytics_idle_service(monkeypatch):
+    """Shared youtube_analytics service for tests that should fail before any API call."""
+    yield from _install_idle_service(monkeypatch, "strands_pack.youtube_analytics", "_get_service")
+
+
+def fake_service(responses):
+    """Plain stand-in for service.<resource>().<method>(**kwargs).execute().
+
+    responses maps (resource, method) to the execute() result. Returns (service, calls), where
+    calls[(resource, method)] collects the kwargs of each call in order.
+    """
+    def recorder(log, response):
+        request = SimpleNamespace(execute=lambda: response)
+
+        def method(**kwargs):
+            log.append(kwargs)
+            return request
+
+        return method
+
+    calls = {key: [] for key in responses}
+    resources = {}
+    for (resource, method), response in responses.items():
+        resources.setdefault(resource, {})[method] = recorder(calls[resource, method], response)
+    service = SimpleNamespace(**{
+        resource: partial(SimpleNamespace, **methods) for resource, methods in resources.items()
+    })
+    return service, calls
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    """Install fake_service(responses) as module_name.attr's service and return its calls."""
+    def install(module_name: str, attr: str, responses):
+        service, calls = fake_service(responses)
+        monkeypatch.setattr(import_module(module_name), attr, lambda **_: service)
+        return calls
+
+    return install
@@ -1,7 +1,18 @@
 """Tests for AWS SNS and SQS tools."""
 
+from importlib import import_module
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+
+def stub_pages(client, *pages):
+    """Make client.get_paginator(...).paginate(...) yield the given response pages; return paginate."""
+    paginate = client.get_paginator.return_value.paginate
+    paginate.return_value = list(pages)
+    return paginate
+
 # =============================================================================
 # Boto3 Import Error Tests
 # =============================================================================
@@ -34,6 +45,77 @@ class TestBoto3ImportErrors:
         assert "boto3 not installed" in result["error"]
 
 
+# =============================================================================
+# Client Reuse Tests
+# =============================================================================
+
+class TestClientReuse:
+    """Test that each tool builds its boto3 client once and reuses it."""
+
+    @pytest.fixture
+    def built(self, monkeypatch):
+        """Empty the shared client cache and record each client built as (profile, service, region, config)."""
+        # Import the actual module (not the tool) for patching internal functions
+        aws_clients = import_module("strands_pack.aws_clients")
+        aws_clients._client_for.cache_clear()
+        for name in ("AWS_REGION", "AWS_PROFILE", "AWS_ACCESS_KEY_ID"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        records = []
+
+        def session(profile_name=None):
+            def client(service, region_name=None, config=None):
+                records.append((profile_name, service, region_name, config))
+                return MagicMock()
+
+            return SimpleNamespace(client=client)
+
+        monkeypatch.setattr(aws_clients.boto3, "Session", session)
+        yield records
+        aws_clients._client_for.cache_clear()
+
+    @pytest.mark.parametrize("module_name,service", [("strands_pack.sns", "sns"), ("strands_pack.sqs", "sqs")])
+    def test_get_client_is_built_once_per_region(self, monkeypatch, built, module_name, service):
+        module = import_module(module_name)
+
+        first = module._get_client()
+        second = module._get_client()
+        monkeypatch.setenv("AWS_REGION", "eu-west-1")
+        other_region = module._get_client()
+
+        assert first is second
+        assert other_region is not first
+        assert [(svc, region) for _, svc, region, _ in built] == [(service, "us-east-1"), (service, "eu-west-1")]
+        config = built[-1][3]
+        assert config.retries == {"mode": "adaptive", "max_attempts": 5}
+        assert config.tcp_keepalive is True
+
+    def test_changed_profile_or_access_key_gets_new_client(self, monkeypatch, built):
+        aws_clients = import_module("strands_pack.aws_clients")
+
+        default = aws_clients.aws_client("sqs")
+        monkeypatch.setenv("AWS_PROFILE", "staging")
+        staging = aws_clients.aws_client("sqs")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "AKIAROTATED")
+        rotated = aws_clients.aws_client("sqs")
+
+        assert len({id(default), id(staging), id(rotated)}) == 3
+        assert rotated is aws_clients.aws_client("sqs")
+        assert [profile for profile, *_ in built] == [None, "staging", "staging"]
+
+    def test_tools_share_one_cache(self, built):
+        aws_clients = import_module("strands_pack.aws_clients")
+        sns_mod = import_module("strands_pack.sns")
+        sqs_mod = import_module("strands_pack.sqs")
+
+        sns_mod._get_client()
+        sqs_mod._get_client()
+        sns_mod._get_lambda()
+
+        assert aws_clients.aws_client("sqs") is sqs_mod._get_client()
+        assert [svc for _, svc, _, _ in built] == ["sns", "sqs", "lambda"]
+
+
 # =============================================================================
 # SNS Tools Tests with Mocking
 # =============================================================================
@@ -107,12 +189,11 @@ class TestSNSListTopics:
     def test_list_topics_success(self, mock_get_client):
         """Test successful topic listing."""
         mock_client = MagicMock()
-        mock_client.list_topics.return_value = {
-            "Topics": [
-                {"TopicArn": "arn:aws:sns:us-east-1:123456789012:topic1"},
-                {"TopicArn": "arn:aws:sns:us-east-1:123456789012:topic2"},
-            ]
-        }
+        stub_pages(
+            mock_client,
+            {"Topics": [{"TopicArn": "arn:aws:sns:us-east-1:123456789012:topic1"}]},
+            {"Topics": [{"TopicArn": "arn:aws:sns:us-east-1:123456789012:topic2"}]},
+        )
         mock_get_client.return_value = mock_client
 
         from strands_pack import sns
@@ -121,13 +202,14 @@ class TestSNSListTopics:
 
         assert result["success"] is True
         assert result["count"] == 2
-        assert len(result["topics"]) == 2
+        assert [t["name"] for t in result["topics"]] == ["topic1", "topic2"]
+        mock_client.get_paginator.assert_called_once_with("list_topics")
 
     @patch("strands_pack.sns._get_client")
     def test_list_topics_empty(self, mock_get_client):
         """Test listing topics when none exist."""
         mock_client = MagicMock()
-        mock_client.list_topics.return_value = {"Topics": []}
+        stub_pages(mock_client, {"Topics": []})
         mock_get_client.return_value = mock_client
 
         from strands_pack import sns
@@ -260,7 +342,7 @@ class TestSNSListSubscriptions:
     def test_list_subscriptions_all(self, mock_get_client):
         """Test listing all subscriptions."""
         mock_client = MagicMock()
-        mock_client.list_subscriptions.return_value = {
+        stub_pages(mock_client, {
             "Subscriptions": [
                 {
                     "SubscriptionArn": "arn:aws:sns:us-east-1:123456789012:topic1:abc",
@@ -269,7 +351,7 @@ class TestSNSListSubscriptions:
                     "TopicArn": "arn:aws:sns:us-east-1:123456789012:topic1"
                 }
             ]
-        }
+        })
         mock_get_client.return_value = mock_client
 
         from strands_pack import sns
@@ -284,7 +366,7 @@ class TestSNSListSubscriptions:
     def test_list_subscriptions_by_topic(self, mock_get_client):
         """Test listing subscriptions filtered by topic."""
         mock_client = MagicMock()
-        mock_client.list_subscriptions_by_topic.return_value = {
+        paginate = stub_pages(mock_client, {
             "Subscriptions": [
                 {
                     "SubscriptionArn": "arn:aws:sns:us-east-1:123456789012:alerts:xyz",
@@ -293,7 +375,7 @@ class TestSNSListSubscriptions:
                     "TopicArn": "arn:aws:sns:us-east-1:123456789012:alerts"
                 }
             ]
-        }
+        })
         mock_get_client.return_value = mock_client
 
         from strands_pack import sns
@@ -302,7 +384,8 @@ class TestSNSListSubscriptions:
         result = sns(action="list_subscriptions", topic_arn=topic_arn)
 
         assert result["success"] is True
-        mock_client.list_subscriptions_by_topic.assert_called_once_with(TopicArn=topic_arn)
+        mock_client.get_paginator.assert_called_once_with("list_subscriptions_by_topic")
+        paginate.assert_called_once_with(TopicArn=topic_arn)
 
 
 class TestSNSGetTopicAttributes:
@@ -414,12 +497,11 @@ class TestSQSListQueues:
     def test_list_queues_success(self, mock_get_client):
         """Test successful queue listing."""
         mock_client = MagicMock()
-        mock_client.list_queues.return_value = {
-            "QueueUrls": [
-                "https://sqs.us-east-1.amazonaws.com/123456789012/queue1",
-                "https://sqs.us-east-1.amazonaws.com/123456789012/queue2",
-            ]
-        }
+        stub_pages(
+            mock_client,
+            {"QueueUrls": ["https://sqs.us-east-1.amazonaws.com/123456789012/queue1"]},
+            {"QueueUrls": ["https://sqs.us-east-1.amazonaws.com/123456789012/queue2"]},
+        )
         mock_get_client.return_value = mock_client
 
         from strands_pack import sqs
@@ -428,17 +510,18 @@ class TestSQSListQueues:
 
         assert result["success"] is True
         assert result["count"] == 2
+        assert [q["name"] for q in result["queues"]] == ["queue1", "queue2"]
 
     @patch("strands_pack.sqs._get_client")
     def test_list_queues_with_prefix(self, mock_get_client):
         """Test listing queues with prefix filter."""
         mock_client = MagicMock()
-        mock_client.list_queues.return_value = {
+        paginate = stub_pages(mock_client, {
             "QueueUrls": [
                 "https://sqs.us-east-1.amazonaws.com/123456789012/prod-orders",
                 "https://sqs.us-east-1.amazonaws.com/123456789012/prod-events",
             ]
-        }
+        })
         mock_get_client.return_value = mock_client
 
         from strands_pack import sqs
@@ -446,7 +529,7 @@ class TestSQSListQueues:
         result = sqs(action="list_queues", queue_name_prefix="prod-")
 
         assert result["success"] is True
-        mock_client.list_queues.assert_called_once_with(QueueNamePrefix="prod-")
+        paginate.assert_called_once_with(QueueNamePrefix="prod-", PaginationConfig={"PageSize": 1000})
 
 
 class TestSQSSend:
@@ -483,6 +566,30 @@ class TestSQSSend:
         assert result["delay_seconds"] == 60
 
 
+class TestSQSSendBatch:
+    """Test sqs send_batch action."""
+
+    @patch("strands_pack.sqs._get_client")
+    def test_send_batch_chunks_by_ten(self, mock_get_client):
+        """Test that more than 10 messages are sent in 10-entry requests."""
+        mock_client = MagicMock()
+        mock_client.send_message_batch.side_effect = lambda QueueUrl, Entries: {
+            "Successful": [{"Id": e["Id"], "MessageId": f"m-{e['Id']}"} for e in Entries],
+        }
+        mock_get_client.return_value = mock_client
+
+        from strands_pack import sqs
+
+        messages = [{"body": f"msg {i}"} for i in range(12)]
+        result = sqs(action="send_batch", queue_url="https://sqs.example/q", messages=messages)
+
+        assert result["success"] is True
+        assert result["successful_count"] == 12
+        assert result["failed_count"] == 0
+        assert sorted(len(c.kwargs["Entries"]) for c in mock_client.send_message_batch.call_args_list) == [2, 10]
+        assert {s["message_id"] for s in result["successful"]} == {f"m-{i}" for i in range(12)}
+
+
 class TestSQSReceive:
     """Test sqs receive action."""
 
@@ -512,6 +619,69 @@ class TestSQSReceive:
         assert result["messages"][0]["body"] == "Test message content"
 
 
+class TestSQSReceiveLongWait:
+    """Test sqs receive with waits longer than one long poll."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake monotonic clock for the sqs module; tests push the readings it returns."""
+        readings = []
+        # Import the actual module (not the tool) for patching internal functions
+        sqs_mod = import_module("strands_pack.sqs")
+        monkeypatch.setattr(sqs_mod, "time", SimpleNamespace(monotonic=lambda: readings.pop(0)))
+        return readings
+
+    @patch("strands_pack.sqs._get_client")
+    def test_receive_repeats_long_polls_until_deadline(self, mock_get_client, clock):
+        mock_client = MagicMock()
+        mock_client.receive_message.return_value = {"Messages": []}
+        mock_get_client.return_value = mock_client
+        clock.extend([0, 0, 20, 40])  # deadline at 45 s; 45, 25 and 5 s left before each poll
+
+        from strands_pack import sqs
+
+        result = sqs(action="receive", queue_url="https://sqs.example/q", wait_time_seconds=45)
+
+        assert result["success"] is True
+        assert result["count"] == 0
+        waits = [c.kwargs["WaitTimeSeconds"] for c in mock_client.receive_message.call_args_list]
+        assert waits == [20, 20, 5]
+
+    @pytest.mark.parametrize("wait, expected", [(1, [1]), (5, [5]), (20, [20]), (21, [20, 1])])
+    @patch("strands_pack.sqs._get_client")
+    def test_receive_rounds_fractional_remaining_up(self, mock_get_client, clock, wait, expected):
+        mock_client = MagicMock()
+        mock_client.receive_message.return_value = {"Messages": []}
+        mock_get_client.return_value = mock_client
+        # Real clocks advance a little between reading the deadline and each poll
+        clock.extend([100.0, 100.004, 120.01])
+
+        from strands_pack import sqs
+
+        sqs(action="receive", queue_url="https://sqs.example/q", wait_time_seconds=wait)
+
+        waits = [c.kwargs["WaitTimeSeconds"] for c in mock_client.receive_message.call_args_list]
+        assert waits == expected
+
+    @patch("strands_pack.sqs._get_client")
+    def test_receive_stops_at_first_message(self, mock_get_client, clock):
+        mock_client = MagicMock()
+        mock_client.receive_message.side_effect = [
+            {"Messages": []},
+            {"Messages": [{"MessageId": "m1", "ReceiptHandle": "rh1", "Body": "hi"}]},
+        ]
+        mock_get_client.return_value = mock_client
+        clock.extend([0, 0, 20])
+
+        from strands_pack import sqs
+
+        result = sqs(action="receive", queue_url="https://sqs.example/q", wait_time_seconds=60)
+
+        assert result["count"] == 1
+        assert result["messages"][0]["message_id"] == "m1"
+        assert mock_client.receive_message.call_count == 2
+
+
 class TestSQSPurge:
     """Test sqs purge action."""
 
@@ -557,6 +727,26 @@ class TestSQSGetQueueAttributes:
         assert result["approximate_messages"] == 5
         assert result["approximate_messages_not_visible"] == 2
         assert result["approximate_messages_delayed"] == 1
+        assert result["fifo_queue"] is False
+        names = mock_client.get_queue_attributes.call_args.kwargs["AttributeNames"]
+        assert "All" not in names
+        assert "ApproximateNumberOfMessages" in names
+
+    @patch("strands_pack.sqs._get_client")
+    def test_get_queue_attributes_fifo_from_queue_name(self, mock_get_client):
+        """Test FIFO queues are detected from the .fifo suffix."""
+        mock_client = MagicMock()
+        mock_client.get_queue_attributes.return_value = {
+            "Attributes": {"QueueArn": "arn:aws:sqs:us-east-1:123456789012:orders.fifo"}
+        }
+        mock_get_client.return_value = mock_client
+
+        from strands_pack import sqs
+
+        queue_url = "https://sqs.us-east-1.amazonaws.com/123456789012/orders.fifo"
+        result = sqs(action="get_queue_attributes", queue_url=queue_url)
+
+        assert result["fifo_queue"] is True
 
 
 class TestSQSDeleteMessage:
@@ -600,6 +790,31 @@ class TestSQSDeleteMessageBatch:
         assert result["deleted_count"] == 3
         assert result["failed_count"] == 0
 
+    @patch("strands_pack.sqs._get_client")
+    def test_delete_message_batch_chunks_by_ten(self, mock_get_client):
+        """Test that more than 10 handles are deleted in 10-entry requests."""
+        def respond(QueueUrl, Entries):
+            ok = [{"Id": e["Id"]} for e in Entries if e["ReceiptHandle"] != "h11"]
+            bad = [{"Id": e["Id"], "Code": "ReceiptHandleIsInvalid", "Message": "bad"} for e in Entries if e["ReceiptHandle"] == "h11"]
+            return {"Successful": ok, "Failed": bad}
+
+        mock_client = MagicMock()
+        mock_client.delete_message_batch.side_effect = respond
+        mock_get_client.return_value = mock_client
+
+        from strands_pack import sqs
+
+        handles = [f"h{i}" for i in range(12)]
+        result = sqs(action="delete_message_batch", queue_url="https://sqs.example/q", receipt_handles=handles)
+
+        assert result["success"] is True
+        assert result["deleted_count"] == 11
+        assert result["failed"] == [{"id": "11", "code": "ReceiptHandleIsInvalid", "message": "bad"}]
+        # Batches may be sent concurrently, so compare them independent of call order
+        batches = sorted((c.kwargs["Entries"] for c in mock_client.delete_message_batch.call_args_list), key=len)
+        assert batches[0] == [{"Id": "10", "ReceiptHandle": "h10"}, {"Id": "11", "ReceiptHandle": "h11"}]
+        assert batches[1] == [{"Id": str(i), "ReceiptHandle": f"h{i}"} for i in range(10)]
+
 
 class TestSQSUnknownAction:
     """Test sqs with unknown action."""
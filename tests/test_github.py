@@ -481,3 +481,24 @@ def test_github_delete_file_auto_sha_and_delete(mock_request, mock_env_token):
     assert payload["sha"] == "filesha"
     assert payload["branch"] == "main"
     assert payload["message"] == "Delete post"
+
+
+def test_github_make_request_reuses_one_session(mock_env_token):
+    """Requests go through a single shared session rather than requests.request."""
+    from importlib import import_module
+    from unittest.mock import MagicMock
+
+    # Import the actual module (not the tool) for patching internal functions
+    github_mod = import_module("strands_pack.github")
+    session = MagicMock()
+    session.request.return_value = MagicMock(status_code=200, json=lambda: {"login": "octocat"})
+
+    with patch.object(github_mod, "_session", session):
+        first = github_mod._make_request("GET", "/user")
+        second = github_mod._make_request("GET", "/user")
+
+    assert first == second == {"success": True, "data": {"login": "octocat"}}
+    assert session.request.call_count == 2
+    method, url = session.request.call_args.args
+    assert (method, url) == ("GET", "https://api.github.com/user")
+    assert session.request.call_args.kwargs["headers"]["Authorization"] == "Bearer test_token_123"
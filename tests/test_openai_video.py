@@ -1,12 +1,22 @@
 """Tests for OpenAI video tool (Videos API wrapper)."""
 
 import tempfile
+from importlib import import_module
 from pathlib import Path
 
 import pytest
 
 from strands_pack.openai_video import openai_video
 
+# Import the actual module (not the tool) for patching internal functions
+openai_video_mod = import_module("strands_pack.openai_video")
+
+
+@pytest.fixture(autouse=True)
+def _no_poll_floor(monkeypatch):
+    """Let wait-loop tests poll with a zero interval instead of sleeping a real second."""
+    monkeypatch.setattr(openai_video_mod, "_MIN_POLL_INTERVAL_SECONDS", 0)
+
 
 class _FakeStream:
     def __init__(self, b: bytes):
@@ -77,7 +87,7 @@ def test_generate_end_to_end_saves_file():
             prompt="A test video",
             client_override=client,
             output_dir=td,
-            poll_interval_seconds=1,
+            poll_interval_seconds=0,
             max_wait_seconds=5,
         )
         assert res["success"] is True
@@ -31,61 +31,38 @@ def sample_qr_path(output_dir):
     return path
 
 
-def test_qrcode_generate(output_dir):
-    """Test generating a QR code."""
+@pytest.mark.parametrize(
+    "action,filename,extra,checks",
+    [
+        ("generate", "test_qr.png", {"data": "Hello, World!"}, {"data_length": len("Hello, World!")}),
+        (
+            "generate",
+            "test_qr_custom.png",
+            {"data": "Test data", "size": 15, "error_correction": "H", "border": 2},
+            {"size": 15, "error_correction": "H", "border": 2},
+        ),
+        (
+            "generate_styled",
+            "styled_qr.png",
+            {"data": "Styled QR", "fill_color": "blue", "back_color": "yellow"},
+            {"fill_color": "blue", "back_color": "yellow", "has_logo": False},
+        ),
+        ("generate_svg", "test_qr.svg", {"data": "SVG QR Code"}, {}),
+    ],
+    ids=["generate", "generate_with_options", "generate_styled", "generate_svg"],
+)
+def test_qrcode_generate_variants(output_dir, action, filename, extra, checks):
+    """Test the QR code generation actions and their option echoes."""
     from strands_pack import qrcode_tool
 
-    output_path = os.path.join(output_dir, "test_qr.png")
-    result = qrcode_tool(
-        action="generate",
-        data="Hello, World!",
-        output_path=output_path,
-    )
+    output_path = os.path.join(output_dir, filename)
+    result = qrcode_tool(action=action, output_path=output_path, **extra)
 
     assert result["success"] is True
-    assert result["action"] == "generate"
+    assert result["action"] == action
     assert os.path.exists(output_path)
-    assert result["data_length"] == len("Hello, World!")
-
-
-def test_qrcode_generate_with_options(output_dir):
-    """Test generating a QR code with custom options."""
-    from strands_pack import qrcode_tool
-
-    output_path = os.path.join(output_dir, "test_qr_custom.png")
-    result = qrcode_tool(
-        action="generate",
-        data="Test data",
-        output_path=output_path,
-        size=15,
-        error_correction="H",
-        border=2,
-    )
-
-    assert result["success"] is True
-    assert result["size"] == 15
-    assert result["error_correction"] == "H"
-    assert result["border"] == 2
-
-
-def test_qrcode_generate_styled(output_dir):
-    """Test generating a styled QR code."""
-    from strands_pack import qrcode_tool
-
-    output_path = os.path.join(output_dir, "styled_qr.png")
-    result = qrcode_tool(
-        action="generate_styled",
-        data="Styled QR",
-        output_path=output_path,
-        fill_color="blue",
-        back_color="yellow",
-    )
-
-    assert result["success"] is True
-    assert result["action"] == "generate_styled"
-    assert result["fill_color"] == "blue"
-    assert result["back_color"] == "yellow"
-    assert result["has_logo"] is False
+    for key, expected in checks.items():
+        assert result[key] == expected
 
 
 def test_qrcode_decode(sample_qr_path):
@@ -123,22 +100,6 @@ def test_qrcode_decode_all(sample_qr_path):
     assert len(result["codes"]) >= 1
 
 
-def test_qrcode_generate_svg(output_dir):
-    """Test generating a QR code as SVG."""
-    from strands_pack import qrcode_tool
-
-    output_path = os.path.join(output_dir, "test_qr.svg")
-    result = qrcode_tool(
-        action="generate_svg",
-        data="SVG QR Code",
-        output_path=output_path,
-    )
-
-    assert result["success"] is True
-    assert result["action"] == "generate_svg"
-    assert os.path.exists(output_path)
-
-
 def test_qrcode_get_info(sample_qr_path):
     """Test getting QR code info."""
     try:
@@ -1,4 +1,18 @@
-from unittest.mock import patch
+from importlib import import_module
+from types import SimpleNamespace
+
+import pytest
+
+# Import the actual module (not the tool) for patching internal functions
+secrets_manager_mod = import_module("strands_pack.secrets_manager")
+
+
+@pytest.fixture
+def sm_client(monkeypatch):
+    """Route strands_pack.secrets_manager._get_client to whatever fake is assigned to `.current`."""
+    holder = SimpleNamespace(current=None)
+    monkeypatch.setattr(secrets_manager_mod, "_get_client", lambda *a, **k: holder.current)
+    return holder
 
 
 def test_secrets_manager_invalid_action():
@@ -9,63 +23,46 @@ def test_secrets_manager_invalid_action():
     assert res["error_type"] == "InvalidAction"
 
 
-def test_secrets_manager_get_secret_ref_does_not_return_secret():
+def test_secrets_manager_get_secret_ref_does_not_return_secret(sm_client):
     from strands_pack.secrets_manager import secrets_manager
 
-    class FakeClient:
-        def get_secret_value(self, SecretId):
-            return {"SecretString": "SUPER_SECRET", "VersionId": "v1"}
-
-    with patch("strands_pack.secrets_manager._get_client", return_value=FakeClient()):
-        res = secrets_manager(action="get_secret_ref", secret_id="name")
+    sm_client.current = SimpleNamespace(get_secret_value=lambda SecretId: {"SecretString": "SUPER_SECRET", "VersionId": "v1"})
+    res = secrets_manager(action="get_secret_ref", secret_id="name")
     assert res["success"] is True
     assert "secret_ref" in res
     assert "SUPER_SECRET" not in str(res)
 
 
-def test_secrets_manager_describe_secret_returns_metadata_only():
+def test_secrets_manager_describe_secret_returns_metadata_only(sm_client):
     from strands_pack.secrets_manager import secrets_manager
 
-    class FakeClient:
-        def describe_secret(self, SecretId):
-            return {
-                "ARN": "arn:aws:secretsmanager:us-east-1:123:secret:my",
-                "Name": "my",
-                "Description": "d",
-                "Tags": [{"Key": "managed-by", "Value": "strands-pack"}],
-            }
-
-    with patch("strands_pack.secrets_manager._get_client", return_value=FakeClient()):
-        res = secrets_manager(action="describe_secret", secret_id="my")
+    sm_client.current = SimpleNamespace(
+        describe_secret=lambda SecretId: {
+            "ARN": "arn:aws:secretsmanager:us-east-1:123:secret:my",
+            "Name": "my",
+            "Description": "d",
+            "Tags": [{"Key": "managed-by", "Value": "strands-pack"}],
+        }
+    )
+    res = secrets_manager(action="describe_secret", secret_id="my")
     assert res["success"] is True
     assert res["name"] == "my"
     assert "SUPER_SECRET" not in str(res)
 
 
-def test_secrets_manager_tag_secret_calls_tag_and_untag():
+def test_secrets_manager_tag_secret_calls_tag_and_untag(sm_client):
     from strands_pack.secrets_manager import secrets_manager
 
-    class FakeClient:
-        def __init__(self):
-            self.tagged = False
-            self.untagged = False
-
-        def tag_resource(self, **kwargs):
-            self.tagged = True
-            assert kwargs["SecretId"] == "my"
-            return {}
-
-        def untag_resource(self, **kwargs):
-            self.untagged = True
-            assert kwargs["SecretId"] == "my"
-            return {}
-
-    fc = FakeClient()
-    with patch("strands_pack.secrets_manager._get_client", return_value=fc):
-        res = secrets_manager(action="tag_secret", secret_id="my", add_tags={"a": "b"}, remove_tag_keys=["x"])
+    tagged = []
+    untagged = []
+    sm_client.current = SimpleNamespace(
+        tag_resource=lambda **kw: tagged.append(kw) or {},
+        untag_resource=lambda **kw: untagged.append(kw) or {},
+    )
+    res = secrets_manager(action="tag_secret", secret_id="my", add_tags={"a": "b"}, remove_tag_keys=["x"])
     assert res["success"] is True
-    assert fc.tagged is True
-    assert fc.untagged is True
+    assert [c["SecretId"] for c in tagged] == ["my"]
+    assert [c["SecretId"] for c in untagged] == ["my"]
 
 
 def test_secrets_manager_delete_secret_requires_confirm():
@@ -76,18 +73,14 @@ def test_secrets_manager_delete_secret_requires_confirm():
     assert res["error_type"] == "ConfirmationRequired"
 
 
-def test_secrets_manager_delete_secret_requires_managed_tag_by_default():
+def test_secrets_manager_delete_secret_requires_managed_tag_by_default(sm_client):
     from strands_pack.secrets_manager import secrets_manager
 
-    class FakeClient:
-        def describe_secret(self, SecretId):
-            return {"Tags": [{"Key": "managed-by", "Value": "someone-else"}]}
-
-        def delete_secret(self, **kwargs):  # pragma: no cover
-            return {}
-
-    with patch("strands_pack.secrets_manager._get_client", return_value=FakeClient()):
-        res = secrets_manager(action="delete_secret", secret_id="my", confirm=True)
+    sm_client.current = SimpleNamespace(
+        describe_secret=lambda SecretId: {"Tags": [{"Key": "managed-by", "Value": "someone-else"}]},
+        delete_secret=lambda **_: {},  # pragma: no cover
+    )
+    res = secrets_manager(action="delete_secret", secret_id="my", confirm=True)
     assert res["success"] is False
     assert res["error_type"] == "NotManaged"
 
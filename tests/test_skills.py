@@ -3,17 +3,9 @@ from pathlib import Path
 
 import pytest
 
+from strands_pack.skills import _parse_frontmatter
 
-@pytest.fixture
-def skills_dir(tmp_path):
-    """Create a temporary skills directory with test skills (Anthropic format)."""
-    skills_path = tmp_path / ".agent-skills"
-    skills_path.mkdir()
-
-    # Create task-with-reminder skill (directory-based)
-    task_skill = skills_path / "task-with-reminder"
-    task_skill.mkdir()
-    (task_skill / "Skill.md").write_text("""---
+_TASK_SKILL_MD = b"""---
 name: Task with Reminder
 description: Create a task with Google Tasks and Calendar reminders
 dependencies: google_tasks, google_calendar
@@ -28,19 +20,14 @@ Create tasks with reminders using Google Tasks and Calendar.
 1. Parse the task title and due date
 2. Create task in Google Tasks
 3. Create calendar event with reminders
-""")
-    # Create a script
-    scripts_dir = task_skill / "scripts"
-    scripts_dir.mkdir()
-    (scripts_dir / "create_task.py").write_text("""#!/usr/bin/env python3
+"""
+
+_CREATE_TASK_PY = b"""#!/usr/bin/env python3
 def create_task(title, due):
     print(f"Creating task: {title}")
-""")
+"""
 
-    # Create github-to-social skill (directory-based)
-    github_skill = skills_path / "github-to-social"
-    github_skill.mkdir()
-    (github_skill / "Skill.md").write_text("""---
+_GITHUB_SKILL_MD = b"""---
 name: GitHub to Social
 description: Announce GitHub releases across social platforms
 dependencies: github, discord, linkedin
@@ -55,17 +42,14 @@ Announce releases on Discord and LinkedIn.
 1. Get release info from GitHub
 2. Post to Discord
 3. Post to LinkedIn
-""")
-    # Create a reference file
-    (github_skill / "REFERENCE.md").write_text("""# Reference
+"""
+
+_GITHUB_REFERENCE_MD = b"""# Reference
 
 Additional documentation for the skill.
-""")
+"""
 
-    # Create simple skill (directory-based, minimal)
-    simple_skill = skills_path / "simple-skill"
-    simple_skill.mkdir()
-    (simple_skill / "Skill.md").write_text("""---
+_SIMPLE_SKILL_MD = b"""---
 name: Simple Skill
 description: A simple test skill
 ---
@@ -73,11 +57,9 @@ description: A simple test skill
 # Simple Skill
 
 Just do the thing.
-""")
+"""
 
-    # Create flat file skill (backwards compatibility)
-    flat_skill = skills_path / "legacy-skill.md"
-    flat_skill.write_text("""---
+_LEGACY_SKILL_MD = b"""---
 name: Legacy Skill
 description: Old-style flat file skill
 ---
@@ -85,7 +67,42 @@ description: Old-style flat file skill
 # Legacy
 
 This is a flat file skill for backwards compatibility.
-""")
+"""
+
+
+@pytest.fixture
+def skills_dir(fs):
+    """Create a skills directory with test skills (Anthropic format).
+
+    Backed by pyfakefs (`fs`), so all skill files live in memory.
+    """
+    skills_path = Path("/skills-test/.agent-skills")
+    skills_path.mkdir(parents=True)
+
+    # Create task-with-reminder skill (directory-based)
+    task_skill = skills_path / "task-with-reminder"
+    task_skill.mkdir()
+    (task_skill / "Skill.md").write_bytes(_TASK_SKILL_MD)
+    # Create a script
+    scripts_dir = task_skill / "scripts"
+    scripts_dir.mkdir()
+    (scripts_dir / "create_task.py").write_bytes(_CREATE_TASK_PY)
+
+    # Create github-to-social skill (directory-based)
+    github_skill = skills_path / "github-to-social"
+    github_skill.mkdir()
+    (github_skill / "Skill.md").write_bytes(_GITHUB_SKILL_MD)
+    # Create a reference file
+    (github_skill / "REFERENCE.md").write_bytes(_GITHUB_REFERENCE_MD)
+
+    # Create simple skill (directory-based, minimal)
+    simple_skill = skills_path / "simple-skill"
+    simple_skill.mkdir()
+    (simple_skill / "Skill.md").write_bytes(_SIMPLE_SKILL_MD)
+
+    # Create flat file skill (backwards compatibility)
+    flat_skill = skills_path / "legacy-skill.md"
+    flat_skill.write_bytes(_LEGACY_SKILL_MD)
 
     return skills_path
 
@@ -293,48 +310,37 @@ def test_skills_read_script_missing_params(skills_dir):
     assert "script is required" in result["error"]
 
 
-def test_skills_read_resource(skills_dir):
-    """Test reading a resource file."""
-    from strands_pack.skills import skills
-
-    # Create a resource
+@pytest.fixture
+def resources_ready(skills_dir):
+    """Populate the task-with-reminder skill with a text and a binary resource."""
     resource_dir = skills_dir / "task-with-reminder" / "resources"
-    resource_dir.mkdir()
+    resource_dir.mkdir(exist_ok=True)
     (resource_dir / "config.json").write_text('{"key": "value"}')
-
-    result = skills(
-        action="read_resource",
-        name="task-with-reminder",
-        resource="config.json",
-        skills_dir=str(skills_dir)
-    )
-
-    assert result["success"] is True
-    assert result["action"] == "read_resource"
-    assert result["resource"] == "config.json"
-    assert '"key"' in result["content"]
+    (resource_dir / "image.png").write_bytes(b'\x89PNG\r\n\x1a\n')
+    return resource_dir
 
 
-def test_skills_read_resource_binary(skills_dir):
-    """Test reading a binary resource returns path."""
+@pytest.mark.parametrize("resource,expect", [("config.json", "content"), ("image.png", "path")])
+def test_skills_read_resource(skills_dir, resources_ready, resource, expect):
+    """Test reading a resource file (text returns content, binary returns path)."""
     from strands_pack.skills import skills
 
-    # Create a binary resource
-    resource_dir = skills_dir / "task-with-reminder" / "resources"
-    resource_dir.mkdir(exist_ok=True)
-    (resource_dir / "image.png").write_bytes(b'\x89PNG\r\n\x1a\n')
-
     result = skills(
         action="read_resource",
         name="task-with-reminder",
-        resource="image.png",
+        resource=resource,
         skills_dir=str(skills_dir)
     )
 
     assert result["success"] is True
-    assert "path" in result
-    assert "content" not in result
-    assert "Binary file" in result.get("note", "")
+    assert result["action"] == "read_resource"
+    assert result["resource"] == resource
+    if expect == "content":
+        assert '"key"' in result["content"]
+    else:
+        assert "path" in result
+        assert "content" not in result
+        assert "Binary file" in result.get("note", "")
 
 
 def test_skills_invalid_action():
@@ -374,8 +380,6 @@ description: Test skill from env
 
 def test_skills_frontmatter_parsing():
     """Test frontmatter parsing function directly."""
-    from strands_pack.skills import _parse_frontmatter
-
     content = """---
 name: Test Skill
 description: Test description
@@ -396,8 +400,6 @@ Body text here.
 
 def test_skills_frontmatter_parsing_no_frontmatter():
     """Test parsing content without frontmatter."""
-    from strands_pack.skills import _parse_frontmatter
-
     content = """# Just Content
 
 No frontmatter here.
@@ -1,247 +1,161 @@
 """Tests for SQLite tool."""
 
 import os
-import tempfile
+import sqlite3
+import uuid
 
 import pytest
 
+from strands_pack import sqlite
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary database file."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        yield f.name
-    os.unlink(f.name)
+# Shared create_table schemas (the tool only reads these)
+_USERS_EMAIL_COLS = {"id": "INTEGER", "name": "TEXT", "email": "TEXT"}
+_ID_EMAIL_COLS = {"id": "INTEGER", "email": "TEXT"}
+_ID_ONLY_COLS = {"id": "INTEGER"}
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temp directory."""
-    with tempfile.TemporaryDirectory() as d:
-        yield d
-
+def temp_db(tmp_path):
+    """Create a temporary database file in WAL journal mode.
 
-def test_sqlite_create_table(temp_db):
-    """Test creating a table."""
-    from strands_pack import sqlite
+    journal_mode=WAL is stored in the database header, so every connection
+    the tool opens on this file inherits it (fewer fsyncs per commit).
+    pytest removes tmp_path, including the -wal/-shm side files.
+    """
+    path = str(tmp_path / "t.db")
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.close()
+    return path
 
-    result = sqlite(
-        action="create_table",
-        db_path=temp_db,
-        table="users",
-        columns={"id": "INTEGER", "name": "TEXT", "email": "TEXT"},
-        primary_key="id",
-    )
 
-    assert result["success"] is True
-    assert result["action"] == "create_table"
-    assert result["table"] == "users"
+@pytest.fixture
+def temp_db_mem():
+    """Create a unique shared-cache in-memory database URI.
 
+    An anchor connection keeps the database alive across the tool's
+    per-call connections for the duration of the test.
+    """
+    uri = f"file:memdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    anchor = sqlite3.connect(uri, uri=True)
+    yield uri
+    anchor.close()
 
-def test_sqlite_insert_single(temp_db):
-    """Test inserting a single row."""
-    from strands_pack import sqlite
-
-    # Create table first
-    sqlite(
-        action="create_table",
-        db_path=temp_db,
-        table="users",
-        columns={"id": "INTEGER", "name": "TEXT"},
-    )
 
+def setup_users(db, rows):
+    """Create a users(id, name) table and insert rows with one execute_script call."""
+    values = ", ".join(f"({row_id}, '{name}')" for row_id, name in rows)
     result = sqlite(
-        action="insert",
-        db_path=temp_db,
-        table="users",
-        data={"id": 1, "name": "Alice"},
+        action="execute_script",
+        db_path=db,
+        sql=f"CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT); BEGIN; INSERT INTO users (id, name) VALUES {values}; COMMIT;",
     )
-
     assert result["success"] is True
-    assert result["action"] == "insert"
-    assert result["inserted"] == 1
 
 
-def test_sqlite_insert_multiple(temp_db):
-    """Test inserting multiple rows."""
-    from strands_pack import sqlite
+@pytest.fixture(scope="module")
+def users_seed_db():
+    """Module-wide in-memory users table seeded with Alice (1) and Bob (2)."""
+    uri = f"file:memdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    anchor = sqlite3.connect(uri, uri=True)
+    setup_users(uri, [(1, "Alice"), (2, "Bob")])
+    yield anchor
+    anchor.close()
 
-    sqlite(
-        action="create_table",
-        db_path=temp_db,
-        table="users",
-        columns={"id": "INTEGER", "name": "TEXT"},
-    )
-
-    result = sqlite(
-        action="insert",
-        db_path=temp_db,
-        table="users",
-        data=[
-            {"id": 1, "name": "Alice"},
-            {"id": 2, "name": "Bob"},
-            {"id": 3, "name": "Charlie"},
-        ],
-    )
-
-    assert result["success"] is True
-    assert result["inserted"] == 3
-
-
-def test_sqlite_query(temp_db):
-    """Test querying data."""
-    from strands_pack import sqlite
-
-    sqlite(
-        action="create_table",
-        db_path=temp_db,
-        table="users",
-        columns={"id": "INTEGER", "name": "TEXT"},
-    )
-    sqlite(
-        action="insert",
-        db_path=temp_db,
-        table="users",
-        data=[{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}],
-    )
-
-    result = sqlite(
-        action="query",
-        db_path=temp_db,
-        sql="SELECT * FROM users ORDER BY id",
-    )
-
-    assert result["success"] is True
-    assert result["action"] == "query"
-    assert result["count"] == 2
-    assert result["results"][0]["name"] == "Alice"
-    assert result["results"][1]["name"] == "Bob"
 
+@pytest.fixture
+def users_db(users_seed_db, temp_db_mem):
+    """Function-scoped copy of the seeded users DB, safe to mutate."""
+    dest = sqlite3.connect(temp_db_mem, uri=True)
+    users_seed_db.backup(dest)
+    dest.close()
+    return temp_db_mem
 
-def test_sqlite_query_with_params(temp_db):
-    """Test querying with parameters."""
-    from strands_pack import sqlite
-
-    sqlite(
-        action="create_table",
-        db_path=temp_db,
-        table="users",
-        columns={"id": "INTEGER", "name": "TEXT"},
-    )
-    sqlite(
-        action="insert",
-        db_path=temp_db,
-        table="users",
-        data=[{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}],
-    )
 
+def test_sqlite_create_table(temp_db_mem):
+    """Test creating a table."""
     result = sqlite(
-        action="query",
-        db_path=temp_db,
-        sql="SELECT * FROM users WHERE name = ?",
-        params=["Alice"],
-    )
-
-    assert result["success"] is True
-    assert result["count"] == 1
-    assert result["results"][0]["name"] == "Alice"
-
-
-def test_sqlite_update(temp_db):
-    """Test updating rows."""
-    from strands_pack import sqlite
-
-    sqlite(
         action="create_table",
-        db_path=temp_db,
-        table="users",
-        columns={"id": "INTEGER", "name": "TEXT"},
-    )
-    sqlite(
-        action="insert",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users",
-        data={"id": 1, "name": "Alice"},
-    )
-
-    result = sqlite(
-        action="update",
-        db_path=temp_db,
-        table="users",
-        data={"name": "Alicia"},
-        where="id = ?",
-        where_params=[1],
+        columns=_USERS_EMAIL_COLS,
+        primary_key="id",
     )
 
     assert result["success"] is True
-    assert result["action"] == "update"
-    assert result["rowcount"] == 1
-
-    # Verify update
-    query_result = sqlite(
-        action="query",
-        db_path=temp_db,
-        sql="SELECT name FROM users WHERE id = 1",
-    )
-    assert query_result["results"][0]["name"] == "Alicia"
+    assert result["action"] == "create_table"
+    assert result["table"] == "users"
 
 
-def test_sqlite_delete(temp_db):
-    """Test deleting rows."""
-    from strands_pack import sqlite
-
-    sqlite(
-        action="create_table",
-        db_path=temp_db,
-        table="users",
-        columns={"id": "INTEGER", "name": "TEXT"},
-    )
-    sqlite(
-        action="insert",
-        db_path=temp_db,
-        table="users",
-        data=[{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}],
-    )
-
-    result = sqlite(
-        action="delete",
-        db_path=temp_db,
-        table="users",
-        where="id = ?",
-        where_params=[1],
-    )
+@pytest.mark.parametrize(
+    "action,args,expected,verify",
+    [
+        ("insert", {"table": "users", "data": {"id": 3, "name": "Charlie"}}, {"inserted": 1}, None),
+        (
+            "insert",
+            {"table": "users", "data": [{"id": 3, "name": "Charlie"}, {"id": 4, "name": "Dana"}, {"id": 5, "name": "Eve"}]},
+            {"inserted": 3},
+            None,
+        ),
+        (
+            "query",
+            {"sql": "SELECT * FROM users ORDER BY id"},
+            {"count": 2, "results": [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]},
+            None,
+        ),
+        (
+            "query",
+            {"sql": "SELECT * FROM users WHERE name = ?", "params": ["Alice"]},
+            {"count": 1, "results": [{"id": 1, "name": "Alice"}]},
+            None,
+        ),
+        (
+            "update",
+            {"table": "users", "data": {"name": "Alicia"}, "where": "id = ?", "where_params": [1]},
+            {"rowcount": 1},
+            ("SELECT name FROM users WHERE id = 1", [{"name": "Alicia"}]),
+        ),
+        ("delete", {"table": "users", "where": "id = ?", "where_params": [1]}, {"rowcount": 1}, None),
+        (
+            "upsert",
+            {"table": "users", "data": {"id": 1, "name": "Alicia"}},
+            {"upserted": 1},
+            ("SELECT name FROM users WHERE id = 1", [{"name": "Alicia"}]),
+        ),
+    ],
+    ids=["insert_single", "insert_multiple", "query", "query_with_params", "update", "delete", "upsert_replace"],
+)
+def test_sqlite_crud(users_db, action, args, expected, verify):
+    """Test row-level CRUD actions against a copy of the seeded users table."""
+    result = sqlite(action=action, db_path=users_db, **args)
 
     assert result["success"] is True
-    assert result["action"] == "delete"
-    assert result["rowcount"] == 1
+    assert result["action"] == action
+    for key, value in expected.items():
+        assert result[key] == value
 
-    # Verify deletion
-    query_result = sqlite(
-        action="query",
-        db_path=temp_db,
-        sql="SELECT COUNT(*) as count FROM users",
-    )
-    assert query_result["results"][0]["count"] == 1
+    if verify:
+        sql, rows = verify
+        query_result = sqlite(action="query", db_path=users_db, sql=sql)
+        assert query_result["results"] == rows
 
 
-def test_sqlite_list_tables(temp_db):
+def test_sqlite_list_tables(temp_db_mem):
     """Test listing tables."""
-    from strands_pack import sqlite
-
     sqlite(
         action="create_table",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users",
-        columns={"id": "INTEGER"},
+        columns=_ID_ONLY_COLS,
     )
     sqlite(
         action="create_table",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="orders",
-        columns={"id": "INTEGER"},
+        columns=_ID_ONLY_COLS,
     )
 
-    result = sqlite(action="list_tables", db_path=temp_db)
+    result = sqlite(action="list_tables", db_path=temp_db_mem)
 
     assert result["success"] is True
     assert result["action"] == "list_tables"
@@ -249,21 +163,19 @@ def test_sqlite_list_tables(temp_db):
     assert "orders" in result["tables"]
 
 
-def test_sqlite_describe_table(temp_db):
+def test_sqlite_describe_table(temp_db_mem):
     """Test describing a table."""
-    from strands_pack import sqlite
-
     sqlite(
         action="create_table",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users",
-        columns={"id": "INTEGER", "name": "TEXT", "email": "TEXT"},
+        columns=_USERS_EMAIL_COLS,
         primary_key="id",
     )
 
     result = sqlite(
         action="describe_table",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users",
     )
 
@@ -277,20 +189,18 @@ def test_sqlite_describe_table(temp_db):
     assert id_col["primary_key"] is True
 
 
-def test_sqlite_drop_table(temp_db):
+def test_sqlite_drop_table(temp_db_mem):
     """Test dropping a table."""
-    from strands_pack import sqlite
-
     sqlite(
         action="create_table",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users",
-        columns={"id": "INTEGER"},
+        columns=_ID_ONLY_COLS,
     )
 
     result = sqlite(
         action="drop_table",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users",
     )
 
@@ -298,22 +208,20 @@ def test_sqlite_drop_table(temp_db):
     assert result["action"] == "drop_table"
 
     # Verify table is gone
-    list_result = sqlite(action="list_tables", db_path=temp_db)
+    list_result = sqlite(action="list_tables", db_path=temp_db_mem)
     assert "users" not in list_result["tables"]
 
 
-def test_sqlite_get_info(temp_db):
+def test_sqlite_get_info(temp_db_mem):
     """Test getting database info."""
-    from strands_pack import sqlite
-
     sqlite(
         action="create_table",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users",
-        columns={"id": "INTEGER"},
+        columns=_ID_ONLY_COLS,
     )
 
-    result = sqlite(action="get_info", db_path=temp_db)
+    result = sqlite(action="get_info", db_path=temp_db_mem)
 
     assert result["success"] is True
     assert result["action"] == "get_info"
@@ -321,15 +229,13 @@ def test_sqlite_get_info(temp_db):
     assert "sqlite_version" in result
 
 
-def test_sqlite_backup(temp_db, temp_dir):
+def test_sqlite_backup(temp_db, tmp_path):
     """Test backing up a database."""
-    from strands_pack import sqlite
-
     sqlite(
         action="create_table",
         db_path=temp_db,
         table="users",
-        columns={"id": "INTEGER"},
+        columns=_ID_ONLY_COLS,
     )
     sqlite(
         action="insert",
@@ -338,7 +244,7 @@ def test_sqlite_backup(temp_db, temp_dir):
         data={"id": 1},
     )
 
-    backup_path = os.path.join(temp_dir, "backup.db")
+    backup_path = str(tmp_path / "backup.db")
     result = sqlite(
         action="backup",
         db_path=temp_db,
@@ -358,40 +264,18 @@ def test_sqlite_backup(temp_db, temp_dir):
     assert query_result["results"][0]["count"] == 1
 
 
-def test_sqlite_upsert_replace(temp_db):
-    """Test upsert via INSERT OR REPLACE."""
-    from strands_pack import sqlite
-
-    sqlite(
-        action="create_table",
-        db_path=temp_db,
-        table="users",
-        columns={"id": "INTEGER", "name": "TEXT"},
-        primary_key="id",
-    )
-    sqlite(action="insert", db_path=temp_db, table="users", data={"id": 1, "name": "Alice"})
-
-    res = sqlite(action="upsert", db_path=temp_db, table="users", data={"id": 1, "name": "Alicia"})
-    assert res["success"] is True
-    assert res["action"] == "upsert"
-    q = sqlite(action="query", db_path=temp_db, sql="SELECT name FROM users WHERE id = 1")
-    assert q["results"][0]["name"] == "Alicia"
-
-
-def test_sqlite_create_and_drop_index(temp_db):
+def test_sqlite_create_and_drop_index(temp_db_mem):
     """Test create_index and drop_index."""
-    from strands_pack import sqlite
-
     sqlite(
         action="create_table",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users",
-        columns={"id": "INTEGER", "email": "TEXT"},
+        columns=_ID_EMAIL_COLS,
     )
 
     res = sqlite(
         action="create_index",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users",
         index_name="idx_users_email",
         index_columns=["email"],
@@ -402,84 +286,68 @@ def test_sqlite_create_and_drop_index(temp_db):
     # Index exists
     q = sqlite(
         action="query",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         sql="SELECT name FROM sqlite_master WHERE type='index' AND name = ?",
         params=["idx_users_email"],
     )
     assert q["count"] == 1
 
-    res2 = sqlite(action="drop_index", db_path=temp_db, index_name="idx_users_email")
+    res2 = sqlite(action="drop_index", db_path=temp_db_mem, index_name="idx_users_email")
     assert res2["success"] is True
     q2 = sqlite(
         action="query",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         sql="SELECT name FROM sqlite_master WHERE type='index' AND name = ?",
         params=["idx_users_email"],
     )
     assert q2["count"] == 0
 
 
-def test_sqlite_truncate_requires_confirm(temp_db):
+def test_sqlite_truncate_requires_confirm(temp_db_mem):
     """Truncate should require confirm=True."""
-    from strands_pack import sqlite
-
-    sqlite(action="create_table", db_path=temp_db, table="t", columns={"id": "INTEGER"})
-    sqlite(action="insert", db_path=temp_db, table="t", data=[{"id": 1}, {"id": 2}])
+    sqlite(action="create_table", db_path=temp_db_mem, table="t", columns=_ID_ONLY_COLS)
+    sqlite(action="insert", db_path=temp_db_mem, table="t", data=[{"id": 1}, {"id": 2}])
 
-    res = sqlite(action="truncate", db_path=temp_db, table="t")
+    res = sqlite(action="truncate", db_path=temp_db_mem, table="t")
     assert res["success"] is False
     assert res.get("error_type") == "ConfirmationRequired"
 
 
-def test_sqlite_export_import_csv_roundtrip(temp_db, temp_dir):
+def test_sqlite_export_import_csv_roundtrip(temp_db_mem, tmp_path):
     """Export a table to CSV, then import into a new table."""
-    from pathlib import Path
+    setup_users(temp_db_mem, [(1, "Alice"), (2, "Bob")])
 
-    from strands_pack import sqlite
-
-    sqlite(action="create_table", db_path=temp_db, table="users", columns={"id": "INTEGER", "name": "TEXT"})
-    sqlite(
-        action="insert",
-        db_path=temp_db,
-        table="users",
-        data=[{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}],
-    )
-
-    csv_path = str(Path(temp_dir) / "users.csv")
-    exp = sqlite(action="export_csv", db_path=temp_db, table="users", csv_path=csv_path)
+    csv_path = str(tmp_path / "users.csv")
+    exp = sqlite(action="export_csv", db_path=temp_db_mem, table="users", csv_path=csv_path)
     assert exp["success"] is True
     assert exp["rows_exported"] == 2
 
     imp = sqlite(
         action="import_csv",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users2",
         csv_path=csv_path,
         create_table_if_missing=True,
     )
     assert imp["success"] is True
 
-    q = sqlite(action="query", db_path=temp_db, sql="SELECT COUNT(*) as c FROM users2")
+    q = sqlite(action="query", db_path=temp_db_mem, sql="SELECT COUNT(*) as c FROM users2")
     assert q["results"][0]["c"] == 2
 
 
 def test_sqlite_vacuum(temp_db):
     """VACUUM should succeed on file-backed DB."""
-    from strands_pack import sqlite
-
-    sqlite(action="create_table", db_path=temp_db, table="t", columns={"id": "INTEGER"})
+    sqlite(action="create_table", db_path=temp_db, table="t", columns=_ID_ONLY_COLS)
     res = sqlite(action="vacuum", db_path=temp_db)
     assert res["success"] is True
     assert res["action"] == "vacuum"
 
 
-def test_sqlite_execute_raw_sql(temp_db):
+def test_sqlite_execute_raw_sql(temp_db_mem):
     """Test executing raw SQL."""
-    from strands_pack import sqlite
-
     result = sqlite(
         action="execute",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         sql="CREATE TABLE test (id INTEGER PRIMARY KEY, value TEXT)",
     )
 
@@ -489,8 +357,6 @@ def test_sqlite_execute_raw_sql(temp_db):
 
 def test_sqlite_memory_database():
     """Test using in-memory database."""
-    from strands_pack import sqlite
-
     # Note: Each call creates a new in-memory DB, so this just tests the path works
     result = sqlite(
         action="execute",
@@ -501,15 +367,61 @@ def test_sqlite_memory_database():
     assert result["success"] is True
 
 
-def test_sqlite_invalid_table_name(temp_db):
-    """Test error on invalid table name."""
-    from strands_pack import sqlite
+def test_sqlite_uri_db_path(temp_db, temp_db_mem, tmp_path):
+    """SQLite file: URIs work for both on-disk and in-memory databases."""
+    sqlite(action="create_table", db_path=f"file:{temp_db}", table="t", columns=_ID_ONLY_COLS)
+
+    info = sqlite(action="get_info", db_path=f"file:{temp_db}?mode=rw")
+    assert info["success"] is True
+    assert info["table_count"] == 1
+    assert info["file_size_bytes"] > 0
+
+    res = sqlite(action="backup", db_path=temp_db_mem, backup_path=str(tmp_path / "b.db"))
+    assert res["success"] is False
+    assert "in-memory" in res["error"]
+
+
+@pytest.mark.parametrize("make_uri", [
+    lambda home: "file:~/data/my%20db.sqlite?mode=rwc",
+    lambda home: "file://" + str(home / "data" / "my%20db.sqlite"),
+], ids=["tilde", "authority"])
+def test_sqlite_uri_resolves_same_file_everywhere(make_uri, tmp_path, monkeypatch):
+    """get_info/backup inspect the file the connection opened (~ expanded, %XX decoded)."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    db_path = make_uri(tmp_path)
+
+    assert sqlite(action="create_table", db_path=db_path, table="t", columns=_ID_ONLY_COLS)["success"] is True
+    assert (tmp_path / "data" / "my db.sqlite").exists()
+
+    info = sqlite(action="get_info", db_path=db_path)
+    assert info["success"] is True
+    assert info["table_count"] == 1
+
+    res = sqlite(action="backup", db_path=db_path, backup_path=str(tmp_path / "b.db"))
+    assert res["success"] is True
+    assert sqlite(action="list_tables", db_path=str(tmp_path / "b.db"))["tables"] == ["t"]
 
+
+def test_sqlite_uri_mode_memory_in_path_is_on_disk(tmp_path, monkeypatch):
+    """Only a mode=memory query parameter makes a URI in-memory, not the same text in the path."""
+    monkeypatch.chdir(tmp_path)
+    db_path = "file:mode=memory.db"
+    sqlite(action="create_table", db_path=db_path, table="t", columns=_ID_ONLY_COLS)
+
+    info = sqlite(action="get_info", db_path=db_path)
+    assert info["file_size_bytes"] == (tmp_path / "mode=memory.db").stat().st_size > 0
+
+    res = sqlite(action="backup", db_path=db_path, backup_path=str(tmp_path / "b.db"))
+    assert res["success"] is True
+
+
+def test_sqlite_invalid_table_name(temp_db_mem):
+    """Test error on invalid table name."""
     result = sqlite(
         action="create_table",
-        db_path=temp_db,
+        db_path=temp_db_mem,
         table="users; DROP TABLE--",
-        columns={"id": "INTEGER"},
+        columns=_ID_ONLY_COLS,
     )
 
     assert result["success"] is False
@@ -518,8 +430,6 @@ def test_sqlite_invalid_table_name(temp_db):
 
 def test_sqlite_missing_db_path():
     """Test error when db_path is missing."""
-    from strands_pack import sqlite
-
     result = sqlite(action="list_tables")
 
     assert result["success"] is False
@@ -528,8 +438,6 @@ def test_sqlite_missing_db_path():
 
 def test_sqlite_unknown_action():
     """Test error for unknown action."""
-    from strands_pack import sqlite
-
     result = sqlite(action="unknown_action", db_path=":memory:")
 
     assert result["success"] is False
@@ -539,10 +447,8 @@ def test_sqlite_unknown_action():
 
 def test_sqlite_env_default_db_path(temp_db, monkeypatch):
     """If SQLITE_DB_PATH is set, db_path can be omitted."""
-    from strands_pack import sqlite
-
     monkeypatch.setenv("SQLITE_DB_PATH", temp_db)
-    sqlite(action="create_table", table="t", columns={"id": "INTEGER"})
+    sqlite(action="create_table", table="t", columns=_ID_ONLY_COLS)
     res = sqlite(action="list_tables")
     assert res["success"] is True
     assert "t" in res["tables"]
@@ -1,7 +1,12 @@
 """Tests for utility tools."""
 
 import tempfile
+from datetime import date, datetime
+from importlib import import_module
 from pathlib import Path
+from uuid import UUID
+
+import pytest
 
 
 def test_validate_email_valid():
@@ -60,6 +65,31 @@ def test_count_lines_in_file():
         Path(temp_path).unlink()
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 1 << 20])
+@pytest.mark.parametrize("text", [
+    "a\r\nb\rc\n",
+    "  \t\r\n \r\n\n x \r\n",
+    "long line " * 20 + "\n\u00a0\u3000\n   \n\tend",
+    "   ",
+    "\n\n",
+    "no newline",
+], ids=["crlf-cr", "blank-crlf", "long-unicode-ws", "blank-only", "newlines-only", "no-newline"])
+def test_count_lines_in_file_matches_readlines(tmp_path, monkeypatch, chunk_size, text):
+    """Test chunked counting against readlines() with lines split across chunk boundaries."""
+    from strands_pack import count_lines_in_file
+
+    monkeypatch.setattr(import_module("strands_pack.utilities"), "_READ_CHUNK_SIZE", chunk_size)
+    path = tmp_path / "lines.txt"
+    path.write_bytes(text.encode("utf-8"))
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+
+    result = count_lines_in_file(str(path))
+
+    assert result["total_lines"] == len(lines)
+    assert result["non_empty_lines"] == len([line for line in lines if line.strip()])
+
+
 def test_count_lines_file_not_found():
     """Test counting lines in non-existent file."""
     from strands_pack import count_lines_in_file
@@ -124,6 +154,101 @@ def test_save_and_load_json():
         assert load_result["data"] == data
 
 
+def test_save_and_load_json_in_memory():
+    """Test serializing and parsing JSON without touching disk."""
+    from strands_pack import load_json, save_json
+
+    data = {"name": "test", "values": [1, 2, 3]}
+
+    save_result = save_json(data=data, pretty=False)
+    assert save_result["success"] is True
+    assert "file_path" not in save_result
+    assert save_result["size_bytes"] == len(save_result["json"].encode("utf-8"))
+
+    assert load_json(content=save_result["json"])["data"] == data
+    assert load_json(content=save_result["json"].encode("utf-8"))["data"] == data
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(request, monkeypatch):
+    """Run a test once with the stdlib codec and once with orjson (when installed)."""
+    utilities = import_module("strands_pack.utilities")
+    if request.param == "orjson":
+        monkeypatch.setattr(utilities, "orjson", pytest.importorskip("orjson"), raising=False)
+    monkeypatch.setattr(utilities, "HAS_ORJSON", request.param == "orjson")
+    return request.param
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_save_json_output_matches_stdlib(json_backend, pretty):
+    """Test that both codecs write exactly what json.dumps would."""
+    import json
+
+    from strands_pack import save_json
+
+    data = {"name": "caf\u00e9", "values": [1, 2.5, 1e16, None, True], "nested": {"empty": [], "obj": {}}, 3: "int key"}
+
+    result = save_json(data=data, pretty=pretty)
+
+    assert result["success"] is True
+    assert result["json"] == json.dumps(data, indent=2 if pretty else None, ensure_ascii=False)
+
+
+def test_save_and_load_json_wide_integers(json_backend):
+    """Test that integers outside the 64-bit range round-trip exactly."""
+    from strands_pack import load_json, save_json
+
+    data = {"big": 2**70, "low": -(2**63) - 1, "neg19": -9999999999999999999}
+
+    saved = save_json(data=data)
+
+    assert saved["success"] is True
+    assert load_json(content=saved["json"])["data"] == data
+    assert load_json(content=saved["json"].encode("utf-8"))["data"] == data
+
+
+def test_save_json_non_finite_floats_round_trip(json_backend):
+    """Test that NaN/Infinity are written as json.dumps writes them, not as null."""
+    import json
+    import math
+
+    from strands_pack import load_json, save_json
+
+    data = {"x": float("nan"), "y": [math.inf, -math.inf]}
+
+    saved = save_json(data=data)
+
+    assert saved["json"] == json.dumps(data, indent=2, ensure_ascii=False)
+    loaded = load_json(content=saved["json"])["data"]
+    assert math.isnan(loaded["x"])
+    assert loaded["y"] == [math.inf, -math.inf]
+
+
+@pytest.mark.parametrize("value", [datetime(2026, 1, 1), UUID(int=0), {date(2026, 1, 1): "date key"}],
+                         ids=["datetime", "uuid", "date-key"])
+def test_save_json_rejects_what_stdlib_rejects(json_backend, value):
+    """Test that values json.dumps can't encode fail with either codec."""
+    from strands_pack import save_json
+
+    result = save_json(data={"value": value})
+
+    assert result["success"] is False
+    assert "not JSON serializable" in result["error"] or "keys must be" in result["error"]
+
+
+def test_load_json_accepts_stdlib_extensions(json_backend):
+    """Test that NaN/Infinity parse as they do with json.loads."""
+    import math
+
+    from strands_pack import load_json
+
+    result = load_json(content="[Infinity, -Infinity, NaN]")
+
+    assert result["success"] is True
+    assert result["data"][:2] == [math.inf, -math.inf]
+    assert math.isnan(result["data"][2])
+
+
 def test_load_json_not_found():
     """Test loading non-existent JSON."""
     from strands_pack import load_json
@@ -149,6 +274,16 @@ def test_load_json_invalid():
         Path(temp_path).unlink()
 
 
+def test_load_json_rejects_non_json_lead_byte():
+    """Test that obviously non-JSON input is rejected before parsing."""
+    from strands_pack import load_json
+
+    result = load_json(content=b"  <html></html>")
+
+    assert result["success"] is False
+    assert result["error"] == "Invalid JSON: unexpected character '<' at position 2"
+
+
 def test_get_env_variable():
     """Test getting environment variables."""
     import os
@@ -228,6 +363,29 @@ def test_extract_urls():
     assert "https://github.com/user/repo" in result["urls"]
 
 
+def test_extract_urls_stops_at_unicode_whitespace():
+    """Test that URLs end at non-ASCII whitespace and vertical tab."""
+    from strands_pack import extract_urls
+
+    result = extract_urls("see https://a.example/x\u00a0next, https://b.example\vmore and https://c.example\u3000end")
+
+    assert result["urls"] == ["https://a.example/x", "https://b.example", "https://c.example"]
+
+
+@pytest.mark.parametrize("engine", ["re", "re2"])
+def test_url_pattern_matches_python_whitespace_in_both_engines(engine):
+    """Test that the URL pattern splits on exactly the characters Python's \\s matches, under re and re2."""
+    import re
+    import sys
+
+    compiled = pytest.importorskip(engine).compile(import_module("strands_pack.utilities")._URL_PATTERN)
+    whitespace = re.findall(r"\s", "".join(map(chr, range(sys.maxunicode + 1))))
+
+    for ch in whitespace:
+        assert compiled.findall(f"https://a.example{ch}tail") == ["https://a.example"], repr(ch)
+    assert compiled.findall("https://a.example\u200btail") == ["https://a.example\u200btail"]
+
+
 def test_extract_urls_empty():
     """Test extracting URLs from text without URLs."""
     from strands_pack import extract_urls
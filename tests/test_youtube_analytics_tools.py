@@ -1,168 +1,257 @@
 """Tests for YouTube Analytics tool (offline/mocked)."""
 
-from unittest.mock import MagicMock, patch
-
-
-def test_youtube_analytics_unknown_action():
-    from strands_pack.youtube_analytics import youtube_analytics
-
-    with patch("strands_pack.youtube_analytics._get_service") as mock_get_service:
-        mock_get_service.return_value = MagicMock()
-        result = youtube_analytics(action="nope")
-        assert result["success"] is False
-        assert "available_actions" in result
-
-
-def test_youtube_analytics_requires_start_date():
-    from strands_pack.youtube_analytics import youtube_analytics
-
-    with patch("strands_pack.youtube_analytics._get_service") as mock_get_service:
-        mock_get_service.return_value = MagicMock()
-        result = youtube_analytics(action="query_report")
-        assert result["success"] is False
-        assert "start_date is required" in result["error"]
-
-
-def test_youtube_analytics_requires_end_date():
-    from strands_pack.youtube_analytics import youtube_analytics
-
-    with patch("strands_pack.youtube_analytics._get_service") as mock_get_service:
-        mock_get_service.return_value = MagicMock()
-        result = youtube_analytics(action="query_report", start_date="2026-01-01")
-        assert result["success"] is False
-        assert "end_date is required" in result["error"]
-
-
-def test_youtube_analytics_requires_metrics():
-    from strands_pack.youtube_analytics import youtube_analytics
-
-    with patch("strands_pack.youtube_analytics._get_service") as mock_get_service:
-        mock_get_service.return_value = MagicMock()
-        result = youtube_analytics(
-            action="query_report",
-            start_date="2026-01-01",
-            end_date="2026-01-07",
-        )
-        assert result["success"] is False
-        assert "metrics is required" in result["error"]
-
-
-def test_youtube_analytics_query_report_calls_api():
-    from strands_pack.youtube_analytics import youtube_analytics
-
-    with patch("strands_pack.youtube_analytics._get_service") as mock_get_service:
-        service = MagicMock()
-        service.reports.return_value.query.return_value.execute.return_value = {
-            "columnHeaders": [{"name": "day"}],
-            "rows": [["2026-01-01"]],
-        }
-        mock_get_service.return_value = service
-
-        result = youtube_analytics(
-            action="query_report",
-            start_date="2026-01-01",
-            end_date="2026-01-07",
-            metrics=["views", "estimatedMinutesWatched"],
-            dimensions=["day"],
-            sort=["day"],
-        )
-
-        assert result["success"] is True
-        service.reports.return_value.query.assert_called_once()
-        _, call_kwargs = service.reports.return_value.query.call_args
-        assert call_kwargs["startDate"] == "2026-01-01"
-        assert call_kwargs["endDate"] == "2026-01-07"
-        assert call_kwargs["metrics"] == "views,estimatedMinutesWatched"
-        assert call_kwargs["dimensions"] == "day"
-        assert call_kwargs["sort"] == "day"
-
-
-def test_youtube_analytics_query_report_with_all_params():
-    from strands_pack.youtube_analytics import youtube_analytics
-
-    with patch("strands_pack.youtube_analytics._get_service") as mock_get_service:
-        service = MagicMock()
-        service.reports.return_value.query.return_value.execute.return_value = {
-            "columnHeaders": [{"name": "views"}],
-            "rows": [[1000]],
-        }
-        mock_get_service.return_value = service
-
-        result = youtube_analytics(
-            action="query_report",
-            ids="channel==UC_x5XG1",
-            start_date="2026-01-01",
-            end_date="2026-01-31",
-            metrics="views",
-            dimensions="video",
-            filters="video==VIDEO_ID",
-            sort="-views",
-            max_results=10,
-            start_index=0,
-            currency="USD",
-            include_historical_channel_data=True,
-        )
-
-        assert result["success"] is True
-        _, call_kwargs = service.reports.return_value.query.call_args
-        assert call_kwargs["ids"] == "channel==UC_x5XG1"
-        assert call_kwargs["maxResults"] == 10
-        assert call_kwargs["startIndex"] == 0
-        assert call_kwargs["currency"] == "USD"
-        assert call_kwargs["includeHistoricalChannelData"] is True
-        assert call_kwargs["filters"] == "video==VIDEO_ID"
-
-
-def test_youtube_analytics_default_ids():
-    from strands_pack.youtube_analytics import youtube_analytics
-
-    with patch("strands_pack.youtube_analytics._get_service") as mock_get_service:
-        service = MagicMock()
-        service.reports.return_value.query.return_value.execute.return_value = {
-            "columnHeaders": [],
-            "rows": [],
-        }
-        mock_get_service.return_value = service
-
-        result = youtube_analytics(
-            action="query_report",
-            start_date="2026-01-01",
-            end_date="2026-01-07",
-            metrics="views",
-        )
-
-        assert result["success"] is True
-        _, call_kwargs = service.reports.return_value.query.call_args
-        assert call_kwargs["ids"] == "channel==MINE"
-
-
-def test_youtube_analytics_auth_required():
-    from strands_pack.youtube_analytics import youtube_analytics
-
-    with patch("strands_pack.youtube_analytics._get_service") as mock_get_service:
-        mock_get_service.return_value = None  # No credentials
-
-        result = youtube_analytics(action="query_report")
-        assert result["success"] is False
-        assert result.get("auth_required") is True
-
-
-def test_youtube_analytics_api_error():
-    from strands_pack.youtube_analytics import youtube_analytics
-
-    with patch("strands_pack.youtube_analytics._get_service") as mock_get_service:
-        service = MagicMock()
-        service.reports.return_value.query.return_value.execute.side_effect = Exception(
-            "API Error"
-        )
-        mock_get_service.return_value = service
-
-        result = youtube_analytics(
-            action="query_report",
-            start_date="2026-01-01",
-            end_date="2026-01-07",
-            metrics="views",
-        )
-
-        assert result["success"] is False
-        assert "API Error" in result["error"]
+from importlib import import_module
+from types import SimpleNamespace
+
+import pytest
+
+from strands_pack import youtube_analytics
+
+# Import the actual module (not the tool) for patching internal functions
+youtube_analytics_mod = import_module("strands_pack.youtube_analytics")
+
+
+@pytest.fixture
+def reports(monkeypatch):
+    """Fake service.reports().query(**kwargs).execute().
+
+    Tests set .response (or .error to raise) and read the recorded query kwargs from .calls.
+    """
+    state = SimpleNamespace(response=None, error=None, calls=[])
+
+    def execute():
+        if state.error is not None:
+            raise state.error
+        return state.response
+
+    request = SimpleNamespace(execute=execute)
+
+    def query(**kwargs):
+        state.calls.append(kwargs)
+        return request
+
+    service = SimpleNamespace(reports=lambda: SimpleNamespace(query=query))
+    monkeypatch.setattr(youtube_analytics_mod, "_get_service", lambda **_: service)
+    return state
+
+
+def test_youtube_analytics_unknown_action(yt_analytics_idle_service):
+    result = youtube_analytics(action="nope")
+    assert result["success"] is False
+    assert "available_actions" in result
+
+
+def test_youtube_analytics_requires_start_date(yt_analytics_idle_service):
+    result = youtube_analytics(action="query_report")
+    assert result["success"] is False
+    assert "start_date is required" in result["error"]
+
+
+def test_youtube_analytics_requires_end_date(yt_analytics_idle_service):
+    result = youtube_analytics(action="query_report", start_date="2026-01-01")
+    assert result["success"] is False
+    assert "end_date is required" in result["error"]
+
+
+def test_youtube_analytics_requires_metrics(yt_analytics_idle_service):
+    result = youtube_analytics(
+        action="query_report",
+        start_date="2026-01-01",
+        end_date="2026-01-07",
+    )
+    assert result["success"] is False
+    assert "metrics is required" in result["error"]
+
+
+def test_youtube_analytics_query_report_calls_api(reports):
+    reports.response = {
+        "columnHeaders": [{"name": "day"}],
+        "rows": [["2026-01-01"]],
+    }
+
+    result = youtube_analytics(
+        action="query_report",
+        start_date="2026-01-01",
+        end_date="2026-01-07",
+        metrics=["views", "estimatedMinutesWatched"],
+        dimensions=["day"],
+        sort=["day"],
+    )
+
+    assert result["success"] is True
+    [call_kwargs] = reports.calls
+    assert call_kwargs["startDate"] == "2026-01-01"
+    assert call_kwargs["endDate"] == "2026-01-07"
+    assert call_kwargs["metrics"] == "views,estimatedMinutesWatched"
+    assert call_kwargs["dimensions"] == "day"
+    assert call_kwargs["sort"] == "day"
+
+
+def test_youtube_analytics_query_report_with_all_params(reports):
+    reports.response = {
+        "columnHeaders": [{"name": "views"}],
+        "rows": [[1000]],
+    }
+
+    result = youtube_analytics(
+        action="query_report",
+        ids="channel==UC_x5XG1",
+        start_date="2026-01-01",
+        end_date="2026-01-31",
+        metrics="views",
+        dimensions="video",
+        filters="video==VIDEO_ID",
+        sort="-views",
+        max_results=10,
+        start_index=0,
+        currency="USD",
+        include_historical_channel_data=True,
+    )
+
+    assert result["success"] is True
+    [call_kwargs] = reports.calls
+    assert call_kwargs["ids"] == "channel==UC_x5XG1"
+    assert call_kwargs["maxResults"] == 10
+    assert call_kwargs["startIndex"] == 0
+    assert call_kwargs["currency"] == "USD"
+    assert call_kwargs["includeHistoricalChannelData"] is True
+    assert call_kwargs["filters"] == "video==VIDEO_ID"
+
+
+def test_youtube_analytics_default_ids(reports):
+    reports.response = {
+        "columnHeaders": [],
+        "rows": [],
+    }
+
+    result = youtube_analytics(
+        action="query_report",
+        start_date="2026-01-01",
+        end_date="2026-01-07",
+        metrics="views",
+    )
+
+    assert result["success"] is True
+    [call_kwargs] = reports.calls
+    assert call_kwargs["ids"] == "channel==MINE"
+
+
+def test_youtube_analytics_auth_required(monkeypatch):
+    monkeypatch.setattr(youtube_analytics_mod, "_get_service", lambda **_: None)  # No credentials
+
+    result = youtube_analytics(action="query_report")
+    assert result["success"] is False
+    assert result.get("auth_required") is True
+
+
+def test_youtube_analytics_api_error(reports):
+    reports.error = Exception("API Error")
+
+    result = youtube_analytics(
+        action="query_report",
+        start_date="2026-01-01",
+        end_date="2026-01-07",
+        metrics="views",
+    )
+
+    assert result["success"] is False
+    assert "API Error" in result["error"]
+
+
+@pytest.fixture
+def auth(monkeypatch):
+    """Fake get_credentials/discovery build behind an empty service cache.
+
+    Tests set .creds (None means auth needed) and read each built service from .built.
+    """
+    state = SimpleNamespace(creds=None, built=[])
+
+    def build(*args, **kwargs):
+        state.built.append(object())
+        return state.built[-1]
+
+    monkeypatch.setattr(import_module("strands_pack.google_auth"), "get_credentials", lambda **_: state.creds)
+    monkeypatch.setattr(youtube_analytics_mod, "_google_build", build)
+    youtube_analytics_mod.clear_service_cache()
+    yield state
+    youtube_analytics_mod.clear_service_cache()
+
+
+def test_youtube_analytics_service_is_cached_once_authenticated(auth):
+    assert youtube_analytics_mod._get_service() is None  # auth needed is not cached
+
+    auth.creds = SimpleNamespace(client_id="cid", refresh_token="rt-1")
+    first = youtube_analytics_mod._get_service()
+    second = youtube_analytics_mod._get_service()
+
+    assert first is second
+    assert auth.built == [first]
+
+
+def test_youtube_analytics_service_is_rebuilt_after_reauth(auth):
+    auth.creds = SimpleNamespace(client_id="cid", refresh_token="rt-1")
+    first = youtube_analytics_mod._get_service()
+    auth.creds = SimpleNamespace(client_id="cid", refresh_token="rt-2")
+    second = youtube_analytics_mod._get_service()
+
+    assert auth.built == [first, second]
+
+    youtube_analytics_mod.clear_service_cache()
+    assert youtube_analytics_mod._get_service() is not second
+
+
+def test_youtube_analytics_request_builder_keeps_default_timeout():
+    google_http = pytest.importorskip("googleapiclient.http")
+
+    build_request = youtube_analytics_mod._thread_local_request_builder(SimpleNamespace())
+    request = build_request(None, lambda *args: None, "https://example.test", method="GET")
+
+    assert request.http.http.timeout == google_http.DEFAULT_HTTP_TIMEOUT_SEC
+    assert build_request(None, lambda *args: None, "https://example.test").http is request.http
+
+
+def test_youtube_analytics_query_reports_batch(reports):
+    reports.response = {
+        "columnHeaders": [{"name": "views"}],
+        "rows": [[42]],
+    }
+
+    result = youtube_analytics(
+        action="query_reports_batch",
+        reports=[
+            {"start_date": "2026-01-01", "end_date": "2026-01-07", "metrics": ["views"]},
+            {"start_date": "2026-01-01", "end_date": "2026-01-07"},  # missing metrics
+            {"start_date": "2026-01-08", "end_date": "2026-01-14", "metrics": "views", "max_results": 5},
+        ],
+    )
+
+    assert result["success"] is True
+    assert result["count"] == 3
+    assert result["failed"] == 1
+    ok, bad, ok_with_max = result["results"]
+    assert ok["rows"] == [[42]]
+    assert "metrics is required" in bad["error"]
+    assert ok_with_max["request"]["maxResults"] == 5
+    assert len(reports.calls) == 2
+
+
+def test_youtube_analytics_query_reports_batch_malformed_entry(reports):
+    reports.response = {"columnHeaders": [], "rows": [[7]]}
+
+    result = youtube_analytics(
+        action="query_reports_batch",
+        reports=["views last week", {"start_date": "2026-01-01", "end_date": "2026-01-07", "metrics": "views"}],
+    )
+
+    assert result["success"] is True
+    assert result["failed"] == 1
+    bad, ok = result["results"]
+    assert "must be a dict" in bad["error"]
+    assert ok["rows"] == [[7]]
+    assert len(reports.calls) == 1
+
+
+def test_youtube_analytics_query_reports_batch_requires_reports(yt_analytics_idle_service):
+    result = youtube_analytics(action="query_reports_batch")
+    assert result["success"] is False
+    assert "reports is required" in result["error"]